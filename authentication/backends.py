@@ -0,0 +1,17 @@
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import User
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    Default model backend that loads the user's profile in the same query.
+    Views read request.user.profile on almost every request, so joining it
+    here saves a separate SELECT per authenticated request.
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = User.objects.select_related('profile').get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -35,14 +35,10 @@ class UserProfile(models.Model):
         verbose_name = 'User Profile'
         verbose_name_plural = 'User Profiles'
 
-# Signals to automatically create and save user profile
+# Signal to automatically create user profile
+# (profiles are saved explicitly where they change, not on every User save)
 @receiver(post_save, sender=User)
 def create_user_profile(sender, instance, created, **kwargs):
     """Create UserProfile when User is created"""
     if created:
-        UserProfile.objects.create(user=instance)
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save UserProfile when User is saved"""
-    instance.profile.save()
\ No newline at end of file
+        UserProfile.objects.create(user=instance)
\ No newline at end of file
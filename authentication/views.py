@@ -3,6 +3,7 @@ from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from .forms import UserRegistrationForm, UserProfileForm, UserUpdateForm
+from .models import UserProfile
 from django.contrib.auth.forms import AuthenticationForm
 
 def register_view(request):
@@ -19,9 +20,10 @@ def register_view(request):
             # Create user
             user = form.save()
             
-            # Set user type in profile
-            user.profile.user_type = form.cleaned_data.get('user_type')
-            user.profile.save()
+            # Set user type in profile with a single targeted UPDATE
+            UserProfile.objects.filter(user=user).update(
+                user_type=form.cleaned_data.get('user_type')
+            )
             
             # Log the user in
             username = form.cleaned_data.get('username')
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('checkin', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='checkin',
+            index=models.Index(fields=['rsvp', 'checked_in_at'], name='checkin_rsvp_time_idx'),
+        ),
+    ]
@@ -1,5 +1,10 @@
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from events.models import Event
 from rsvp.models import RSVP
 
 class CheckIn(models.Model):
@@ -26,4 +31,34 @@ class CheckIn(models.Model):
         db_table = 'checkins'
         ordering = ['-checked_in_at']
         verbose_name = 'Check-in'
-        verbose_name_plural = 'Check-ins'
\ No newline at end of file
+        verbose_name_plural = 'Check-ins'
+        indexes = [
+            models.Index(fields=['rsvp', 'checked_in_at'], name='checkin_rsvp_time_idx'),
+        ]
+
+
+def refresh_event_checkin_count(event_id):
+    """Recalculate Event.total_checkins in a single UPDATE"""
+    event_checkins = CheckIn.objects.filter(
+        rsvp__event=OuterRef('pk')
+    ).order_by().values('rsvp__event').annotate(
+        count=Count('id')
+    ).values('count')
+    
+    Event.objects.filter(pk=event_id).update(
+        total_checkins=Coalesce(Subquery(event_checkins), 0)
+    )
+
+# Signals to keep the event's check-in counter up to date
+@receiver(post_save, sender=CheckIn)
+def update_event_checkin_count_on_save(sender, instance, created, **kwargs):
+    """Refresh counter when a check-in is recorded"""
+    if created:
+        refresh_event_checkin_count(instance.rsvp.event_id)
+
+@receiver(post_delete, sender=CheckIn)
+def update_event_checkin_count_on_delete(sender, instance, **kwargs):
+    """Refresh counter when a check-in is undone"""
+    event_id = RSVP.objects.filter(pk=instance.rsvp_id).values_list('event_id', flat=True).first()
+    if event_id:
+        refresh_event_checkin_count(event_id)
@@ -1,12 +1,16 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.paginator import Paginator
 from django.utils import timezone
+from django.db import IntegrityError, transaction
 from django.db.models import Count, Q
 from .models import CheckIn
 from .forms import CheckInForm
 from rsvp.models import RSVP
 from events.models import Event
+from events.utils import invalidate_page_cache
+from dashboard.utils import invalidate_analytics_cache
 
 @login_required
 def checkin_dashboard(request, event_slug):
@@ -14,20 +18,25 @@ def checkin_dashboard(request, event_slug):
     Check-in dashboard for event organizers.
     Shows check-in statistics and form.
     """
-    event = get_object_or_404(Event, slug=event_slug)
+    event = get_object_or_404(
+        Event.objects.only('id', 'slug', 'title', 'organizer_id', 'total_rsvps', 'total_checkins'),
+        slug=event_slug
+    )
     
     # Check if user is the organizer
-    if event.organizer != request.user:
+    if event.organizer_id != request.user.id:
         messages.error(request, 'You do not have permission to access this page.')
         return redirect('events:event_detail', slug=event_slug)
     
-    # Get statistics
-    total_rsvps = RSVP.objects.filter(event=event).exclude(status='cancelled').count()
-    checked_in = CheckIn.objects.filter(rsvp__event=event).count()
+    # Get statistics (denormalized counters on the event row)
+    total_rsvps = event.total_rsvps
+    checked_in = event.total_checkins
     pending_checkin = total_rsvps - checked_in
     
     # Recent check-ins
-    recent_checkins = CheckIn.objects.filter(rsvp__event=event).select_related('rsvp__user')[:10]
+    recent_checkins = CheckIn.objects.filter(rsvp__event=event).select_related(
+        'rsvp__user__profile', 'checked_in_by'
+    )[:10]
     
     context = {
         'event': event,
@@ -45,10 +54,13 @@ def perform_checkin(request, event_slug):
     Perform check-in for an attendee.
     Accepts ticket number or QR code data.
     """
-    event = get_object_or_404(Event, slug=event_slug)
+    event = get_object_or_404(
+        Event.objects.only('id', 'slug', 'title', 'organizer_id'),
+        slug=event_slug
+    )
     
     # Check if user is the organizer
-    if event.organizer != request.user:
+    if event.organizer_id != request.user.id:
         messages.error(request, 'You do not have permission to perform check-ins.')
         return redirect('events:event_detail', slug=event_slug)
     
@@ -61,41 +73,51 @@ def perform_checkin(request, event_slug):
             # Extract ticket number from QR code data if necessary
             if 'TICKET:' in ticket_number:
                 # QR code format: TICKET:XXX|EVENT:YYY|USER:ZZZ
-                ticket_number = ticket_number.split('|')[0].replace('TICKET:', '')
+                ticket_number = ticket_number.partition('|')[0].removeprefix('TICKET:')
             
             try:
-                # Find RSVP
-                rsvp = RSVP.objects.get(
-                    ticket_number=ticket_number,
-                    event=event
-                )
-                
-                # Check if already checked in
-                if hasattr(rsvp, 'checkin'):
-                    messages.warning(
-                        request, 
-                        f'{rsvp.user.get_full_name()} has already been checked in at {rsvp.checkin.checked_in_at.strftime("%I:%M %p")}.'
-                    )
-                else:
-                    # Perform check-in
-                    checkin = CheckIn.objects.create(
-                        rsvp=rsvp,
-                        checked_in_by=request.user,
-                        notes=notes
-                    )
-                    
-                    # Update RSVP status
-                    rsvp.mark_attended()
+                # Lock the RSVP row for the duration of the check-in so two
+                # scanners can't both pass the "already checked in" test.
+                # Ticket numbers are unique, so this is a point lookup on the
+                # unique index; the event is verified after the fetch.
+                with transaction.atomic():
+                    rsvp = RSVP.objects.select_for_update(of=('self',)).select_related(
+                        'user', 'checkin'
+                    ).get(ticket_number=ticket_number)
+                    if rsvp.event_id != event.id:
+                        raise RSVP.DoesNotExist
                     
-                    messages.success(
-                        request, 
-                        f'Successfully checked in {rsvp.user.get_full_name()} ({rsvp.number_of_tickets} ticket(s)).'
-                    )
+                    # Check if already checked in
+                    existing_checkin = getattr(rsvp, 'checkin', None)
+                    if existing_checkin is not None:
+                        messages.warning(
+                            request, 
+                            f'{rsvp.user.get_full_name()} has already been checked in at {existing_checkin.checked_in_at.strftime("%I:%M %p")}.'
+                        )
+                    else:
+                        # Perform check-in
+                        checkin = CheckIn.objects.create(
+                            rsvp=rsvp,
+                            checked_in_by=request.user,
+                            notes=notes
+                        )
+                        
+                        # Update RSVP status
+                        rsvp.mark_attended()
+                        
+                        messages.success(
+                            request, 
+                            f'Successfully checked in {rsvp.user.get_full_name()} ({rsvp.number_of_tickets} ticket(s)).'
+                        )
                 
                 return redirect('checkin:checkin_dashboard', event_slug=event_slug)
                 
             except RSVP.DoesNotExist:
                 messages.error(request, 'Invalid ticket number or ticket not found for this event.')
+            except IntegrityError:
+                # The one-to-one constraint caught a concurrent check-in
+                messages.warning(request, 'This ticket has already been checked in.')
+                return redirect('checkin:checkin_dashboard', event_slug=event_slug)
         else:
             messages.error(request, 'Please enter a valid ticket number.')
     else:
@@ -114,18 +136,29 @@ def checkin_list(request, event_slug):
     Display list of all check-ins for an event.
     Sortable and searchable.
     """
-    event = get_object_or_404(Event, slug=event_slug)
+    event = get_object_or_404(
+        Event.objects.only('id', 'slug', 'title', 'organizer_id'),
+        slug=event_slug
+    )
     
     # Check if user is the organizer
-    if event.organizer != request.user:
+    if event.organizer_id != request.user.id:
         messages.error(request, 'You do not have permission to view this page.')
         return redirect('events:event_detail', slug=event_slug)
     
-    checkins = CheckIn.objects.filter(rsvp__event=event).select_related('rsvp__user', 'checked_in_by')
+    checkins = CheckIn.objects.filter(rsvp__event=event).select_related(
+        'rsvp__user__profile', 'checked_in_by'
+    )
     
     # Search functionality
     search_query = request.GET.get('search', '')
-    if search_query:
+    if search_query.upper().startswith('TKT-'):
+        # Ticket numbers are stored upper-case with a fixed prefix, so a
+        # prefix match can use the unique index instead of a '%q%' scan
+        checkins = checkins.filter(
+            rsvp__ticket_number__startswith=search_query.strip().upper()
+        )
+    elif search_query:
         checkins = checkins.filter(
             Q(rsvp__user__first_name__icontains=search_query) |
             Q(rsvp__user__last_name__icontains=search_query) |
@@ -133,9 +166,14 @@ def checkin_list(request, event_slug):
             Q(rsvp__ticket_number__icontains=search_query)
         )
     
+    # Pagination
+    paginator = Paginator(checkins, 50)  # Show 50 check-ins per page
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
     context = {
         'event': event,
-        'checkins': checkins,
+        'page_obj': page_obj,
         'search_query': search_query,
         'title': f'Check-in List - {event.title}'
     }
@@ -144,22 +182,33 @@ def checkin_list(request, event_slug):
 @login_required
 def undo_checkin(request, checkin_id):
     """Undo a check-in (for corrections)"""
-    checkin = get_object_or_404(CheckIn, id=checkin_id)
+    checkin = get_object_or_404(
+        CheckIn.objects.select_related('rsvp__event', 'rsvp__user__profile', 'checked_in_by'),
+        id=checkin_id
+    )
     event = checkin.rsvp.event
     
     # Check if user is the organizer
-    if event.organizer != request.user:
+    if event.organizer_id != request.user.id:
         messages.error(request, 'You do not have permission to undo this check-in.')
         return redirect('events:event_detail', slug=event.slug)
     
     if request.method == 'POST':
-        # Revert RSVP status
-        checkin.rsvp.status = 'confirmed'
-        checkin.rsvp.save()
-        
-        # Delete check-in record
         user_name = checkin.rsvp.user.get_full_name()
-        checkin.delete()
+        
+        with transaction.atomic():
+            # Revert RSVP status
+            RSVP.objects.filter(pk=checkin.rsvp_id).update(
+                status='confirmed',
+                updated_at=timezone.now()
+            )
+            
+            # Delete check-in record
+            CheckIn.objects.filter(pk=checkin.id).delete()
+            
+            # The RSVP update() sends no post_save, so drop the caches it would have
+            invalidate_analytics_cache(event.organizer_id)
+            invalidate_page_cache(event.slug)
         
         messages.success(request, f'Check-in for {user_name} has been undone.')
         return redirect('checkin:checkin_dashboard', event_slug=event.slug)
@@ -0,0 +1,32 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from events.models import Event
+from rsvp.models import RSVP
+from checkin.models import CheckIn
+from .utils import invalidate_analytics_cache
+
+# The dashboard app has no models of its own; these signals keep the
+# cached analytics in sync with the data they are computed from.
+
+def get_event_organizer_id(event_id):
+    """Return the organizer id for an event without loading the full row"""
+    return Event.objects.filter(pk=event_id).values_list('organizer_id', flat=True).first()
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_analytics_on_event_change(sender, instance, **kwargs):
+    """Event created, updated or deleted"""
+    invalidate_analytics_cache(instance.organizer_id)
+
+@receiver(post_save, sender=RSVP)
+@receiver(post_delete, sender=RSVP)
+def invalidate_analytics_on_rsvp_change(sender, instance, **kwargs):
+    """RSVP created, updated or deleted"""
+    invalidate_analytics_cache(get_event_organizer_id(instance.event_id))
+
+@receiver(post_save, sender=CheckIn)
+@receiver(post_delete, sender=CheckIn)
+def invalidate_analytics_on_checkin_change(sender, instance, **kwargs):
+    """Check-in recorded or undone"""
+    event_id = RSVP.objects.filter(pk=instance.rsvp_id).values_list('event_id', flat=True).first()
+    invalidate_analytics_cache(get_event_organizer_id(event_id))
@@ -0,0 +1,15 @@
+from django.core.cache import cache
+
+# Analytics aggregates are cached per organizer for this many seconds
+ANALYTICS_CACHE_TIMEOUT = 300
+
+
+def get_analytics_cache_key(organizer_id):
+    """Cache key for an organizer's analytics page context"""
+    return f'dashboard:analytics:{organizer_id}'
+
+
+def invalidate_analytics_cache(organizer_id):
+    """Drop cached analytics for an organizer so the next visit recomputes them"""
+    if organizer_id:
+        cache.delete(get_analytics_cache_key(organizer_id))
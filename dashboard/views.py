@@ -1,11 +1,49 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Count, Q, Sum
+from django.db.models import Count, Q, Sum, F, ExpressionWrapper, DecimalField
+from django.db.models.functions import TruncMonth
 from datetime import timedelta
 from events.models import Event
 from rsvp.models import RSVP
 from checkin.models import CheckIn
+from .utils import get_analytics_cache_key, ANALYTICS_CACHE_TIMEOUT
+
+def get_next_month_start(month_start):
+    """Return the first moment of the calendar month after month_start"""
+    if month_start.month == 12:
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
+
+def get_month_starts(count):
+    """
+    Return the first moment of each of the last `count` calendar months,
+    oldest first, ending with the current month.
+    """
+    current = timezone.localtime().replace(
+        day=1, hour=0, minute=0, second=0, microsecond=0
+    )
+    months = [current]
+    for _ in range(count - 1):
+        previous = months[0] - timedelta(days=1)
+        months.insert(0, previous.replace(day=1))
+    return months
+
+def count_by_month(queryset, date_field):
+    """
+    Count rows per calendar month of date_field in a single GROUP BY query.
+    Returns a dict keyed by (year, month).
+    """
+    rows = queryset.annotate(
+        month=TruncMonth(date_field)
+    ).values('month').annotate(
+        count=Count('id')
+    ).order_by()
+    return {
+        (row['month'].year, row['month'].month): row['count']
+        for row in rows
+    }
 
 @login_required
 def home(request):
@@ -32,10 +70,13 @@ def organizer_dashboard(request):
     my_events = Event.objects.filter(organizer=user)
     
     # Event Statistics
-    total_events = my_events.count()
-    published_events = my_events.filter(status='published').count()
-    draft_events = my_events.filter(status='draft').count()
-    completed_events = my_events.filter(status='completed').count()
+    event_stats = my_events.aggregate(
+        total=Count('id'),
+        published=Count('id', filter=Q(status='published')),
+        draft=Count('id', filter=Q(status='draft')),
+        completed=Count('id', filter=Q(status='completed')),
+        checkins=Sum('total_checkins')
+    )
     
     # Upcoming events
     upcoming_events = my_events.filter(
@@ -48,87 +89,73 @@ def organizer_dashboard(request):
         status='published'
     ).order_by('-created_at')[:5]
     
-    # RSVP Statistics
-    total_rsvps = RSVP.objects.filter(
+    # RSVP Statistics (including total tickets sold)
+    rsvp_stats = RSVP.objects.filter(
         event__organizer=user
-    ).exclude(status='cancelled').count()
-    
-    confirmed_rsvps = RSVP.objects.filter(
-        event__organizer=user,
-        status='confirmed'
-    ).count()
+    ).aggregate(
+        total=Count('id', filter=~Q(status='cancelled')),
+        confirmed=Count('id', filter=Q(status='confirmed')),
+        attended=Count('id', filter=Q(status='attended')),
+        tickets=Sum('number_of_tickets', filter=~Q(status='cancelled'))
+    )
     
-    attended_rsvps = RSVP.objects.filter(
+    # Revenue calculation (for paid events)
+    total_revenue = RSVP.objects.filter(
         event__organizer=user,
-        status='attended'
-    ).count()
-    
-    # Total tickets sold
-    total_tickets = RSVP.objects.filter(
-        event__organizer=user
+        event__event_type='paid'
     ).exclude(status='cancelled').aggregate(
-        total=Sum('number_of_tickets')
-    )['total'] or 0
-    
-    # Revenue calculation (for paid events)
-    total_revenue = 0
-    paid_events = my_events.filter(event_type='paid')
-    for event in paid_events:
-        event_rsvps = RSVP.objects.filter(
-            event=event
-        ).exclude(status='cancelled')
-        event_tickets = sum(rsvp.number_of_tickets for rsvp in event_rsvps)
-        total_revenue += event_tickets * float(event.ticket_price)
-    
-    # Check-in Statistics
-    total_checkins = CheckIn.objects.filter(
-        rsvp__event__organizer=user
-    ).count()
+        revenue=Sum(
+            ExpressionWrapper(
+                F('number_of_tickets') * F('event__ticket_price'),
+                output_field=DecimalField()
+            )
+        )
+    )['revenue'] or 0
     
     # Recent RSVPs
     recent_rsvps = RSVP.objects.filter(
         event__organizer=user
     ).exclude(status='cancelled').select_related(
-        'event', 'user'
+        'event', 'user', 'user__profile'
     ).order_by('-created_at')[:10]
     
     # Monthly event stats (last 6 months)
-    monthly_stats = []
-    for i in range(5, -1, -1):
-        month_start = timezone.now() - timedelta(days=30*i)
-        month_end = month_start + timedelta(days=30)
-        
-        events_count = my_events.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).count()
-        
-        rsvps_count = RSVP.objects.filter(
+    months = get_month_starts(6)
+    events_by_month = count_by_month(
+        my_events.filter(created_at__gte=months[0]),
+        'created_at'
+    )
+    rsvps_by_month = count_by_month(
+        RSVP.objects.filter(
             event__organizer=user,
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).exclude(status='cancelled').count()
-        
+            created_at__gte=months[0]
+        ).exclude(status='cancelled'),
+        'created_at'
+    )
+    
+    monthly_stats = []
+    for month_start in months:
+        key = (month_start.year, month_start.month)
         monthly_stats.append({
             'month': month_start.strftime('%b %Y'),
-            'events': events_count,
-            'rsvps': rsvps_count
+            'events': events_by_month.get(key, 0),
+            'rsvps': rsvps_by_month.get(key, 0)
         })
     
     context = {
         'user_type': 'organizer',
-        'total_events': total_events,
-        'published_events': published_events,
-        'draft_events': draft_events,
-        'completed_events': completed_events,
+        'total_events': event_stats['total'],
+        'published_events': event_stats['published'],
+        'draft_events': event_stats['draft'],
+        'completed_events': event_stats['completed'],
         'upcoming_events': upcoming_events,
         'recent_events': recent_events,
-        'total_rsvps': total_rsvps,
-        'confirmed_rsvps': confirmed_rsvps,
-        'attended_rsvps': attended_rsvps,
-        'total_tickets': total_tickets,
+        'total_rsvps': rsvp_stats['total'],
+        'confirmed_rsvps': rsvp_stats['confirmed'],
+        'attended_rsvps': rsvp_stats['attended'],
+        'total_tickets': rsvp_stats['tickets'] or 0,
         'total_revenue': total_revenue,
-        'total_checkins': total_checkins,
+        'total_checkins': event_stats['checkins'] or 0,
         'recent_rsvps': recent_rsvps,
         'monthly_stats': monthly_stats,
         'title': 'Organizer Dashboard'
@@ -146,11 +173,11 @@ def attendee_dashboard(request):
     # Get user's RSVPs
     my_rsvps = RSVP.objects.filter(user=user).select_related('event')
     
-    # Upcoming registered events
-    upcoming_registered = my_rsvps.filter(
+    # Upcoming registered events (evaluated once, reused for the count)
+    upcoming_registered = list(my_rsvps.filter(
         status__in=['confirmed', 'pending'],
         event__start_date__gte=timezone.now()
-    ).order_by('event__start_date')[:5]
+    ).order_by('event__start_date')[:5])
     
     # Past attended events
     past_attended = my_rsvps.filter(
@@ -160,16 +187,15 @@ def attendee_dashboard(request):
     # Statistics
     total_registered = my_rsvps.exclude(status='cancelled').count()
     total_attended = my_rsvps.filter(status='attended').count()
-    upcoming_count = upcoming_registered.count()
+    upcoming_count = len(upcoming_registered)
     
     # Available upcoming events (not registered)
-    registered_event_ids = my_rsvps.values_list('event_id', flat=True)
-    available_events = Event.objects.filter(
+    available_events = list(Event.objects.filter(
         status='published',
         start_date__gte=timezone.now()
     ).exclude(
-        id__in=registered_event_ids
-    ).order_by('start_date')[:6]
+        rsvps__user=user
+    ).order_by('start_date')[:6])
     
     # Recommended events (all available events)
     recommended_events = available_events[:4]
@@ -205,20 +231,41 @@ def analytics(request):
         messages.error(request, 'Access denied. This page is only for organizers.')
         return redirect('dashboard:home')
     
+    # Expensive aggregates are cached per organizer and invalidated
+    # whenever one of their events, RSVPs or check-ins changes
+    context = cache.get_or_set(
+        get_analytics_cache_key(user.id),
+        lambda: get_analytics_context(user),
+        ANALYTICS_CACHE_TIMEOUT
+    )
+    return render(request, 'dashboard/analytics.html', context)
+
+def get_analytics_context(user):
+    """
+    Build the analytics page context for an organizer.
+    All querysets are evaluated so the result can be cached.
+    """
     my_events = Event.objects.filter(organizer=user)
     
-    # Overall Statistics
-    total_events = my_events.count()
+    # Overall Statistics (including free/paid split)
+    event_counts = my_events.aggregate(
+        total=Count('id'),
+        free=Count('id', filter=Q(event_type='free')),
+        paid=Count('id', filter=Q(event_type='paid'))
+    )
     total_views = 0  # Can be implemented with a view tracking system
     
-    # RSVP trends
-    rsvp_data = RSVP.objects.filter(
+    # RSVP trends / attendance rate
+    rsvp_stats = RSVP.objects.filter(
         event__organizer=user
-    ).exclude(status='cancelled')
+    ).exclude(status='cancelled').aggregate(
+        confirmed=Count('id', filter=Q(status='confirmed')),
+        attended=Count('id', filter=Q(status='attended'))
+    )
     
     # Attendance rate
-    total_confirmed = rsvp_data.filter(status='confirmed').count()
-    total_attended = rsvp_data.filter(status='attended').count()
+    total_confirmed = rsvp_stats['confirmed']
+    total_attended = rsvp_stats['attended']
     attendance_rate = (total_attended / total_confirmed * 100) if total_confirmed > 0 else 0
     
     # Event performance (top events by RSVPs)
@@ -227,33 +274,39 @@ def analytics(request):
     ).order_by('-rsvp_count')[:5]
     
     # Monthly trends (last 12 months)
+    months = get_month_starts(12)
+    next_month = get_next_month_start(months[-1])
+    events_by_month = count_by_month(
+        my_events.filter(
+            start_date__gte=months[0],
+            start_date__lt=next_month
+        ),
+        'start_date'
+    )
+    rsvps_by_month = count_by_month(
+        RSVP.objects.filter(
+            event__organizer=user,
+            created_at__gte=months[0]
+        ).exclude(status='cancelled'),
+        'created_at'
+    )
+    checkins_by_month = count_by_month(
+        CheckIn.objects.filter(
+            rsvp__event__organizer=user,
+            checked_in_at__gte=months[0]
+        ),
+        'checked_in_at'
+    )
+    
     monthly_trends = []
-    for i in range(11, -1, -1):
-        month_start = timezone.now() - timedelta(days=30*i)
-        month_end = month_start + timedelta(days=30)
-        
-        month_data = {
+    for month_start in months:
+        key = (month_start.year, month_start.month)
+        monthly_trends.append({
             'month': month_start.strftime('%b'),
-            'events': my_events.filter(
-                start_date__gte=month_start,
-                start_date__lt=month_end
-            ).count(),
-            'rsvps': RSVP.objects.filter(
-                event__organizer=user,
-                created_at__gte=month_start,
-                created_at__lt=month_end
-            ).exclude(status='cancelled').count(),
-            'checkins': CheckIn.objects.filter(
-                rsvp__event__organizer=user,
-                checked_in_at__gte=month_start,
-                checked_in_at__lt=month_end
-            ).count()
-        }
-        monthly_trends.append(month_data)
-    
-    # Revenue by event type
-    free_events = my_events.filter(event_type='free').count()
-    paid_events = my_events.filter(event_type='paid').count()
+            'events': events_by_month.get(key, 0),
+            'rsvps': rsvps_by_month.get(key, 0),
+            'checkins': checkins_by_month.get(key, 0)
+        })
     
     # Location statistics
     location_stats = my_events.values('city').annotate(
@@ -261,13 +314,13 @@ def analytics(request):
     ).order_by('-count')[:5]
     
     context = {
-        'total_events': total_events,
+        'total_events': event_counts['total'],
         'attendance_rate': round(attendance_rate, 2),
-        'top_events': top_events,
+        'top_events': list(top_events),
         'monthly_trends': monthly_trends,
-        'free_events': free_events,
-        'paid_events': paid_events,
-        'location_stats': location_stats,
+        'free_events': event_counts['free'],
+        'paid_events': event_counts['paid'],
+        'location_stats': list(location_stats),
         'title': 'Analytics Dashboard'
     }
-    return render(request, 'dashboard/analytics.html', context)
\ No newline at end of file
+    return context
\ No newline at end of file
@@ -44,7 +44,6 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates'],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -53,6 +52,13 @@ TEMPLATES = [
                 'django.contrib.messages.context_processors.messages',
                 'django.template.context_processors.media',
             ],
+            # Parse each template once per process (pages and email templates)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
         },
     },
 ]
@@ -75,6 +81,29 @@ DATABASES = {
     }
 }
 
+# Authentication backends (loads request.user together with its profile).
+# ModelBackend stays listed so sessions created before the switch keep working.
+AUTHENTICATION_BACKENDS = [
+    'authentication.backends.ProfileModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+# Cache configuration (used for analytics and other read-heavy pages)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',  # Development
+        'LOCATION': 'event-management',
+    }
+}
+# For production with multiple workers, use a shared cache (required: the
+# event page cache versions must be seen by every worker):
+# CACHES = {
+#     'default': {
+#         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+#         'LOCATION': 'redis://127.0.0.1:6379',
+#     }
+# }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -97,9 +126,26 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 # Media files
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+# Event banners are stored under content-hashed names, so in production they
+# can be served from S3/a CDN with far-future caching (needs django-storages):
+# STORAGES = {
+#     'default': {
+#         'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage',
+#     },
+#     'staticfiles': {
+#         'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+#     },
+# }
+# AWS_STORAGE_BUCKET_NAME = 'your-bucket'
+# AWS_S3_CUSTOM_DOMAIN = 'cdn.example.com'
+# AWS_QUERYSTRING_AUTH = False
+# AWS_S3_OBJECT_PARAMETERS = {'CacheControl': 'max-age=31536000, immutable'}
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# Sessions: only write the session when it actually changes
+SESSION_SAVE_EVERY_REQUEST = False
+
 # Login settings
 LOGIN_URL = 'authentication:login'
 LOGIN_REDIRECT_URL = 'dashboard:home'
@@ -108,10 +154,37 @@ LOGOUT_REDIRECT_URL = 'authentication:login'
 # Email configuration (for notifications module)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'  # Development
 DEFAULT_FROM_EMAIL = 'noreply@eventmanagement.com'
+EMAIL_SEND_WORKERS = 4  # Parallel SMTP connections for bulk notifications
+EMAIL_MAX_MESSAGES_PER_CONNECTION = 100  # Reconnect after this many messages
+EMAIL_TIMEOUT = 10  # Seconds before a stalled SMTP connection fails
 # For production, use SMTP:
 # EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 # EMAIL_HOST = 'smtp.gmail.com'
 # EMAIL_PORT = 587
 # EMAIL_USE_TLS = True
 # EMAIL_HOST_USER = 'your-email@gmail.com'
-# EMAIL_HOST_PASSWORD = 'your-app-password'
\ No newline at end of file
+# EMAIL_HOST_PASSWORD = 'your-app-password'
+# Logging (email delivery failures from the notification senders)
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'notifications': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+        },
+        'events': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+        },
+        'rsvp': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+        },
+    },
+}
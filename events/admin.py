@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Event #, Category
+from .models import COUNTER_FIELDS, Event #, Category
 
 # @admin.register(Category)
 # class CategoryAdmin(admin.ModelAdmin):
@@ -13,7 +13,7 @@ class EventAdmin(admin.ModelAdmin):
     list_filter = ['status', 'event_type', 'start_date']
     search_fields = ['title', 'description', 'organizer__username']
     prepopulated_fields = {'slug': ('title',)}
-    readonly_fields = ['created_at', 'updated_at', 'slug']
+    readonly_fields = ['created_at', 'updated_at', 'slug', 'total_rsvps', 'total_checkins']
     date_hierarchy = 'start_date'
     
     fieldsets = (
@@ -27,7 +27,7 @@ class EventAdmin(admin.ModelAdmin):
             'fields': ('venue_name', 'venue_address', 'city', 'state', 'country', 'zip_code')
         }),
         ('Capacity & Pricing', {
-            'fields': ('total_seats', 'available_seats', 'ticket_price')
+            'fields': ('total_seats', 'available_seats', 'ticket_price', 'total_rsvps', 'total_checkins')
         }),
         ('Media', {
             'fields': ('banner_image',)
@@ -36,4 +36,14 @@ class EventAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at'),
             'classes': ('collapse',)
         }),
-    )
\ No newline at end of file
+    )
+    
+    def save_model(self, request, obj, form, change):
+        """Leave the counters (kept by their own UPDATEs) out of edits"""
+        if change:
+            obj.save(update_fields=[
+                field.name for field in obj._meta.concrete_fields
+                if not field.primary_key and field.name not in COUNTER_FIELDS
+            ])
+        else:
+            super().save_model(request, obj, form, change)
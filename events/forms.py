@@ -2,6 +2,9 @@ from django import forms
 from .models import Event #, Category
 from django.utils import timezone
 
+# Shared Tailwind classes for every EventForm input
+INPUT_CSS = 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent'
+
 class EventForm(forms.ModelForm):
     """
     Form for creating and updating events.
@@ -18,11 +21,11 @@ class EventForm(forms.ModelForm):
         ]
         widgets = {
             'title': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'Event Title'
             }),
             'description': forms.Textarea(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'Event Description',
                 'rows': 5
             }),
@@ -32,57 +35,57 @@ class EventForm(forms.ModelForm):
             #     'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent'
             # }),
             'event_type': forms.Select(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent'
+                'class': INPUT_CSS
             }),
             'status': forms.Select(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent'
+                'class': INPUT_CSS
             }),
             'start_date': forms.DateTimeInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'type': 'datetime-local'
             }),
             'end_date': forms.DateTimeInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'type': 'datetime-local'
             }),
             'venue_name': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'Venue Name'
             }),
             'venue_address': forms.Textarea(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'Venue Address',
                 'rows': 3
             }),
             'city': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'City'
             }),
             'state': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'State'
             }),
             'country': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'Country'
             }),
             'zip_code': forms.TextInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'ZIP Code'
             }),
             'total_seats': forms.NumberInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'Total Seats',
                 'min': '1'
             }),
             'ticket_price': forms.NumberInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'placeholder': 'Ticket Price (0.00 for free)',
                 'step': '0.01',
                 'min': '0'
             }),
             'banner_image': forms.FileInput(attrs={
-                'class': 'w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500 focus:border-transparent',
+                'class': INPUT_CSS,
                 'accept': 'image/*'
             })
         }
@@ -95,17 +98,17 @@ class EventForm(forms.ModelForm):
         event_type = cleaned_data.get('event_type')
         ticket_price = cleaned_data.get('ticket_price')
         
-        # Validate dates
+        # Validate dates (errors are attached to their fields so all are shown at once)
         if start_date and end_date:
             if end_date <= start_date:
-                raise forms.ValidationError('End date must be after start date.')
+                self.add_error('end_date', 'End date must be after start date.')
             
             if start_date < timezone.now():
-                raise forms.ValidationError('Start date cannot be in the past.')
+                self.add_error('start_date', 'Start date cannot be in the past.')
         
         # Validate ticket price for paid events
         if event_type == 'paid' and (not ticket_price or ticket_price <= 0):
-            raise forms.ValidationError('Paid events must have a ticket price greater than 0.')
+            self.add_error('ticket_price', 'Paid events must have a ticket price greater than 0.')
         
         return cleaned_data
 
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:17
+
+from django.db import migrations, models
+
+
+def populate_counters(apps, schema_editor):
+    """Backfill the counters for events that already have RSVPs/check-ins"""
+    Event = apps.get_model('events', 'Event')
+    for event in Event.objects.all():
+        event.total_rsvps = event.rsvps.exclude(status='cancelled').count()
+        event.total_checkins = event.rsvps.filter(checkin__isnull=False).count()
+        event.save(update_fields=['total_rsvps', 'total_checkins'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_add_event_indexes'),
+        ('rsvp', '0002_add_rsvp_indexes'),
+        ('checkin', '0002_add_checkin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='total_checkins',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='total_rsvps',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
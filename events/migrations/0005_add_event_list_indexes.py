@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_add_event_counters'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['organizer', '-created_at'], name='ev_org_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['city'], name='ev_city_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:26
+
+from django.db import migrations, models
+import events.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_add_event_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='event',
+            name='banner_image',
+            field=models.ImageField(blank=True, help_text='Event banner image', null=True, upload_to=events.models.banner_upload_to),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:26
+
+from django.db import migrations, models
+import events.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_hash_banner_filenames'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='banner_thumbnail',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to=events.models.banner_thumbnail_upload_to),
+        ),
+    ]
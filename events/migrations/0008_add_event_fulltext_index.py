@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:27
+
+from django.db import migrations
+
+
+def create_fulltext_index(apps, schema_editor):
+    """MySQL only: FULLTEXT index used by events.utils.fulltext_search"""
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(
+            'CREATE FULLTEXT INDEX ev_fts_idx ON events (title, description, city)'
+        )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute('DROP INDEX ev_fts_idx ON events')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_add_banner_thumbnail'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+    ]
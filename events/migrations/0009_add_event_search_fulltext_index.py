@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:52
+
+from django.db import migrations
+
+
+def create_search_fulltext_index(apps, schema_editor):
+    """MySQL only: FULLTEXT index over the columns search_events matches"""
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(
+            'CREATE FULLTEXT INDEX ev_search_fts_idx ON events (title, description, venue_name, city)'
+        )
+
+
+def drop_search_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute('DROP INDEX ev_search_fts_idx ON events')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_add_event_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_fulltext_index, drop_search_fulltext_index),
+    ]
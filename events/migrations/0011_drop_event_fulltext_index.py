@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-14 05:10
+
+from django.db import migrations
+
+
+def drop_fulltext_index(apps, schema_editor):
+    """MySQL only: event_list now matches the ev_search_fts_idx columns"""
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute('DROP INDEX ev_fts_idx ON events')
+
+
+def create_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(
+            'CREATE FULLTEXT INDEX ev_fts_idx ON events (title, description, city)'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_add_event_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_fulltext_index, create_fulltext_index),
+    ]
@@ -1,7 +1,18 @@
+import hashlib
+import os
+
 from django.db import models
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.utils import timezone
 from django.utils.text import slugify
 from django.urls import reverse
+from .utils import invalidate_cities_cache, invalidate_page_cache, make_banner_thumbnail
+
+# Denormalized counters recomputed by RSVP/CheckIn signals with their own UPDATEs
+COUNTER_FIELDS = ('total_rsvps', 'total_checkins')
 
 
 # Category to comment out
@@ -26,6 +37,25 @@ from django.urls import reverse
 #         verbose_name_plural = 'Categories'
 #         ordering = ['name']
 
+def content_hash_name(field_file, directory, filename):
+    """Build '<directory>/<sha256 prefix>.<ext>' from a file's contents"""
+    digest = hashlib.sha256()
+    for chunk in field_file.chunks():
+        digest.update(chunk)
+    extension = os.path.splitext(filename)[1].lower()
+    return f'{directory}/{digest.hexdigest()[:20]}{extension}'
+
+
+def banner_upload_to(instance, filename):
+    """Name banners by content hash so a URL always serves the same image"""
+    return content_hash_name(instance.banner_image, 'event_banners', filename)
+
+
+def banner_thumbnail_upload_to(instance, filename):
+    """Name banner thumbnails by content hash, like the banners themselves"""
+    return content_hash_name(instance.banner_thumbnail, 'event_banners/thumbnails', filename)
+
+
 class Event(models.Model):
     """
     Main event model containing all event information.
@@ -80,6 +110,10 @@ class Event(models.Model):
     total_seats = models.IntegerField()
     available_seats = models.IntegerField()
     
+    # Denormalized counters (kept in sync by RSVP and CheckIn signals)
+    total_rsvps = models.PositiveIntegerField(default=0, editable=False)
+    total_checkins = models.PositiveIntegerField(default=0, editable=False)
+    
     # Pricing
     ticket_price = models.DecimalField(
         max_digits=10, 
@@ -90,11 +124,18 @@ class Event(models.Model):
     
     # Media
     banner_image = models.ImageField(
-        upload_to='event_banners/', 
+        upload_to=banner_upload_to, 
         blank=True, 
         null=True,
         help_text="Event banner image"
     )
+    # Card-sized WebP copy of the banner, regenerated whenever it changes
+    banner_thumbnail = models.ImageField(
+        upload_to=banner_thumbnail_upload_to,
+        blank=True,
+        null=True,
+        editable=False
+    )
     
     # Metadata
     created_at = models.DateTimeField(auto_now_add=True)
@@ -104,17 +145,29 @@ class Event(models.Model):
         """Generate slug and set available seats on creation"""
         if not self.slug:
             base_slug = slugify(self.title)
+            # Fetch every taken "<base>" / "<base>-<n>" slug in one query
+            taken = set(Event.objects.filter(
+                slug__startswith=base_slug
+            ).values_list('slug', flat=True))
+            # Same result as the old exists() loop: the bare slug if free,
+            # otherwise the first free "<base>-<n>"
             slug = base_slug
             counter = 1
-            while Event.objects.filter(slug=slug).exists():
+            while slug in taken:
                 slug = f"{base_slug}-{counter}"
                 counter += 1
             self.slug = slug
         
+        # Regenerate the card thumbnail when a new banner is uploaded
+        if not self.banner_image:
+            self.banner_thumbnail = None
+        elif not self.banner_image._committed:
+            self.banner_thumbnail = make_banner_thumbnail(self.banner_image)
+        
         # Set available seats equal to total seats on first save
         if not self.pk:
             self.available_seats = self.total_seats
-            
+        
         super().save(*args, **kwargs)
     
     def __str__(self):
@@ -127,6 +180,31 @@ class Event(models.Model):
         """Check if event is fully booked"""
         return self.available_seats <= 0
     
+    def reserve_seat(self, seats=1):
+        """
+        Atomically take seats if enough remain and registration is open
+        (published and not started yet).
+        The WHERE clause is the overbooking guard, so no row lock is needed.
+        """
+        reserved = Event.objects.filter(
+            pk=self.pk,
+            status='published',
+            start_date__gt=timezone.now(),
+            available_seats__gte=seats
+        ).update(available_seats=F('available_seats') - seats)
+        if reserved:
+            self.available_seats -= seats
+            # update() sends no post_save; cached pages show the seat count
+            invalidate_page_cache(self.slug)
+        return reserved == 1
+    
+    def release_seat(self, seats=1):
+        """Atomically give seats back, e.g. when a registration is cancelled"""
+        released = Event.objects.filter(pk=self.pk).update(available_seats=F('available_seats') + seats)
+        if released:
+            self.available_seats += seats
+            invalidate_page_cache(self.slug)
+    
     def get_booked_seats(self):
         """Calculate number of booked seats"""
         return self.total_seats - self.available_seats
@@ -137,18 +215,34 @@ class Event(models.Model):
             return (self.get_booked_seats() / self.total_seats) * 100
         return 0
     
-    def is_upcoming(self):
-        """Check if event is upcoming"""
-        from django.utils import timezone
-        return self.start_date > timezone.now()
+    def is_upcoming(self, now=None):
+        """Check if event is upcoming (pass `now` to reuse one timestamp)"""
+        return self.start_date > (now or timezone.now())
     
-    def is_past(self):
-        """Check if event is past"""
-        from django.utils import timezone
-        return self.end_date < timezone.now()
+    def is_past(self, now=None):
+        """Check if event is past (pass `now` to reuse one timestamp)"""
+        return self.end_date < (now or timezone.now())
     
     class Meta:
         db_table = 'events'
         ordering = ['-start_date']
         verbose_name = 'Event'
-        verbose_name_plural = 'Events'
\ No newline at end of file
+        verbose_name_plural = 'Events'
+        indexes = [
+            models.Index(fields=['organizer', 'status'], name='ev_org_status_idx'),
+            models.Index(fields=['status', 'start_date'], name='ev_status_start_idx'),
+            models.Index(fields=['organizer', '-created_at'], name='ev_org_created_idx'),
+            models.Index(fields=['city'], name='ev_city_idx'),
+            models.Index(fields=['status', 'end_date'], name='ev_status_end_idx'),
+            models.Index(fields=['status', 'city'], name='ev_status_city_idx'),
+            models.Index(fields=['status', 'event_type'], name='ev_status_type_idx'),
+            models.Index(fields=['status', 'ticket_price'], name='ev_status_price_idx'),
+        ]
+
+
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+def invalidate_caches_on_event_change(sender, instance, **kwargs):
+    """Event created, updated or deleted; cached cities and pages are stale"""
+    invalidate_cities_cache()
+    invalidate_page_cache(instance.slug)
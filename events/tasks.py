@@ -0,0 +1,110 @@
+"""
+Background email tasks for events.
+
+Tasks take primary keys rather than model instances and reload what they
+need; they are scheduled with notifications.tasks.run_in_background.
+"""
+import logging
+from functools import partial
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, send_mail
+from django.template.loader import get_template, render_to_string
+
+from .models import Event
+from rsvp.models import RSVP
+from notifications.mailer import PooledSender
+from notifications.utils import ATTENDEE_CHUNK_SIZE, ATTENDEE_FIELDS
+
+
+logger = logging.getLogger(__name__)
+
+
+def send_event_created_task(event_id, domain):
+    """Load the event and notify its organizer"""
+    event = Event.objects.select_related('organizer').filter(id=event_id).first()
+    if event is not None:
+        send_event_created_notification(event, domain)
+
+
+def send_event_updated_task(event_id, changes, domain):
+    """Load the event and notify its confirmed attendees"""
+    event = Event.objects.select_related('organizer').filter(id=event_id).first()
+    if event is not None:
+        send_event_updated_notification(event, changes, domain)
+
+
+# Helper Functions for Email Notifications
+
+def send_event_created_notification(event, domain):
+    """Send notification when event is created"""
+    try:
+        context = {
+            'event': event,
+            'domain': domain,
+        }
+
+        subject = f'Event Created: {event.title}'
+        html_message = render_to_string(
+            'notifications/emails/event_created.html',
+            context
+        )
+        plain_message = render_to_string(
+            'notifications/emails/event_created.txt',
+            context
+        )
+
+        send_mail(
+            subject,
+            plain_message,
+            settings.DEFAULT_FROM_EMAIL,
+            [event.organizer.email],
+            html_message=html_message,
+            fail_silently=True,
+        )
+    except Exception as e:
+        logger.warning("Error sending event created notification: %s", e)
+
+
+def send_event_updated_notification(event, changes, domain):
+    """Send notification to attendees when event is updated; returns (sent, failed)"""
+    sender = PooledSender()
+    render_failures = 0
+    try:
+        # Get all confirmed attendees
+        confirmed_rsvps = RSVP.objects.filter(
+            event=event,
+            status='confirmed'
+        ).select_related('user').only(*ATTENDEE_FIELDS)
+
+        subject = f'Event Updated - {event.title}'
+        make_email = partial(
+            EmailMultiAlternatives, subject, from_email=settings.DEFAULT_FROM_EMAIL
+        )
+        html_template = get_template('notifications/emails/event_updated.html')
+        plain_template = get_template('notifications/emails/event_updated.txt')
+        base_context = {
+            'event': event,
+            'changes': changes,
+            'domain': domain,
+        }
+
+        # Stream attendees and deliver over a pooled SMTP connection, in batches
+        with sender:
+            for rsvp in confirmed_rsvps.iterator(chunk_size=ATTENDEE_CHUNK_SIZE):
+                try:
+                    context = base_context | {'attendee': rsvp.user}
+
+                    html_message = html_template.render(context)
+                    plain_message = plain_template.render(context)
+
+                    email = make_email(plain_message, to=[rsvp.user.email])
+                    email.attach_alternative(html_message, 'text/html')
+                    sender.send(email)
+                except Exception as e:
+                    logger.warning("Failed to notify %s: %s", rsvp.user.email, e)
+                    render_failures += 1
+
+    except Exception as e:
+        logger.warning("Error sending event update notifications: %s", e)
+    return sender.sent, sender.failed + render_failures
@@ -0,0 +1,217 @@
+import hashlib
+import os
+import re
+import uuid
+from functools import wraps
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import F, FloatField, Func
+from django.db.models.lookups import GreaterThan
+from django.utils.functional import cached_property
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+
+# Cache key and lifetime for the published-cities filter dropdown
+CITIES_CACHE_KEY = 'events:cities'
+CITIES_CACHE_TIMEOUT = 600
+
+# Anonymous event pages are cached for this many seconds. Each event's
+# detail pages and the list pages have their own prefix version, bumped
+# whenever that event changes. The versions live in the cache itself, so
+# with several workers CACHES must be a shared backend (Redis/Memcached);
+# LocMemCache is per-process and other workers would keep serving stale pages.
+PAGE_CACHE_TIMEOUT = 60
+PAGE_CACHE_LIST_VERSION_KEY = 'events:pages:list:version'
+PAGE_CACHE_EVENT_VERSION_KEY = 'events:pages:event:{slug}:version'
+
+# Size and encoding of the banner thumbnails shown on event cards
+BANNER_THUMBNAIL_SIZE = (600, 400)
+BANNER_THUMBNAIL_QUALITY = 80
+
+# Columns covered by the ev_search_fts_idx FULLTEXT index (MySQL only); a
+# MATCH column list must equal an index's columns exactly to use it
+EVENT_FULLTEXT_COLUMNS = ('title', 'description', 'venue_name', 'city')
+# InnoDB ignores words shorter than innodb_ft_min_token_size (3 by default)
+FULLTEXT_MIN_TOKEN_SIZE = 3
+
+# Seconds a paginated list's total count is reused before recounting
+LIST_COUNT_CACHE_TIMEOUT = 60
+
+
+def get_published_cities():
+    """Sorted distinct cities of published events, cached for the filter dropdowns"""
+    from .models import Event
+
+    return cache.get_or_set(
+        CITIES_CACHE_KEY,
+        lambda: list(Event.objects.filter(
+            status='published'
+        ).values_list('city', flat=True).distinct().order_by('city')),
+        CITIES_CACHE_TIMEOUT
+    )
+
+
+def invalidate_cities_cache():
+    """Drop the cached city list so the next dropdown render rebuilds it"""
+    cache.delete(CITIES_CACHE_KEY)
+
+
+def get_cache_version(version_key):
+    """Current version stored under version_key, created on first use"""
+    return cache.get_or_set(version_key, lambda: uuid.uuid4().hex, None)
+
+
+def get_page_cache_prefix(slug=None):
+    """
+    Key prefix for cached anonymous pages: one event's pages when a slug is
+    given, the event lists otherwise. Changed by invalidate_page_cache().
+    """
+    if slug is None:
+        return f'events:pages:list:{get_cache_version(PAGE_CACHE_LIST_VERSION_KEY)}'
+    version = get_cache_version(PAGE_CACHE_EVENT_VERSION_KEY.format(slug=slug))
+    return f'events:pages:event:{slug}:{version}'
+
+
+def invalidate_page_cache(slug=None):
+    """Orphan the cached event lists and, given a slug, that event's pages"""
+    cache.set(PAGE_CACHE_LIST_VERSION_KEY, uuid.uuid4().hex, None)
+    if slug is not None:
+        cache.set(PAGE_CACHE_EVENT_VERSION_KEY.format(slug=slug), uuid.uuid4().hex, None)
+
+
+def cache_page_for_anonymous(timeout=PAGE_CACHE_TIMEOUT, slug_kwarg=None):
+    """
+    Like cache_page, but only for anonymous visitors; logged-in users always
+    get a freshly rendered page. Responses vary on Cookie so pending flash
+    messages or sessions never leak between visitors.
+    Pages of a single event name the URL kwarg holding its slug, so they are
+    only invalidated when that event changes.
+    """
+    def decorator(view_func):
+        cached_view = vary_on_cookie(view_func)
+        
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.user.is_authenticated:
+                return view_func(request, *args, **kwargs)
+            slug = kwargs[slug_kwarg] if slug_kwarg else None
+            return cache_page(timeout, key_prefix=get_page_cache_prefix(slug))(cached_view)(
+                request, *args, **kwargs
+            )
+        return wrapper
+    return decorator
+
+
+def make_banner_thumbnail(image_file):
+    """Return a cropped, card-sized WebP copy of an uploaded banner"""
+    image_file.seek(0)
+    with Image.open(image_file) as image:
+        thumbnail = ImageOps.fit(
+            ImageOps.exif_transpose(image).convert('RGB'),
+            BANNER_THUMBNAIL_SIZE,
+            Image.LANCZOS
+        )
+    image_file.seek(0)
+    
+    buffer = BytesIO()
+    thumbnail.save(buffer, format='WEBP', quality=BANNER_THUMBNAIL_QUALITY)
+    name = os.path.splitext(os.path.basename(image_file.name))[0]
+    return ContentFile(buffer.getvalue(), name=f'{name}.webp')
+
+
+class FullTextMatch(Func):
+    """
+    MySQL MATCH ... AGAINST in boolean mode; evaluates to the relevance score.
+    The columns are F() references so Django qualifies them with whatever
+    alias the table gets, including inside subqueries.
+    """
+    template = 'MATCH (%(expressions)s) AGAINST (%%s IN BOOLEAN MODE)'
+    output_field = FloatField()
+
+    def __init__(self, columns, boolean_query):
+        super().__init__(*[F(column) for column in columns])
+        self.boolean_query = boolean_query
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = super().as_sql(compiler, connection, **extra_context)
+        return sql, (*params, self.boolean_query)
+
+
+def fulltext_relevance(columns, search_query):
+    """
+    Relevance score of a search over FULLTEXT-indexed columns.
+    Returns None when that isn't possible (another database backend, or a
+    term too short to be indexed) so the caller can fall back to icontains.
+    """
+    if connection.vendor != 'mysql':
+        return None
+    
+    terms = re.findall(r'\w+', search_query)
+    if not terms or any(len(term) < FULLTEXT_MIN_TOKEN_SIZE for term in terms):
+        return None
+    
+    # Every term must match; "+term*" matches words starting with the term,
+    # while the icontains fallback matches it anywhere inside a word
+    boolean_query = ' '.join(f'+{term}*' for term in terms)
+    return FullTextMatch(columns, boolean_query)
+
+
+def fulltext_match(columns, search_query):
+    """
+    MATCH ... AGAINST condition for filter(), or None, see fulltext_relevance().
+    """
+    relevance = fulltext_relevance(columns, search_query)
+    if relevance is None:
+        return None
+    # MATCH returns a relevance score, not 1; compare it in SQL so rows
+    # scoring anything but 1.0 aren't dropped by an "= True" comparison
+    return GreaterThan(relevance, 0)
+
+
+def fulltext_search(queryset, columns, search_query):
+    """
+    Filter with MATCH ... AGAINST so MySQL can use its FULLTEXT index.
+    Returns None when that isn't possible, see fulltext_match().
+    """
+    match = fulltext_match(columns, search_query)
+    if match is None:
+        return None
+    return queryset.filter(match)
+
+
+def get_list_count_cache_key(prefix, query_params):
+    """
+    Cache key for a list's total count under a given set of GET filters.
+    It includes the list page version, so any event change recounts.
+    """
+    params = query_params.copy()
+    params.pop('page', None)
+    digest = hashlib.md5(params.urlencode().encode()).hexdigest()
+    version = get_cache_version(PAGE_CACHE_LIST_VERSION_KEY)
+    return f'{prefix}:{version}:count:{digest}'
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that reuses the total row count for a short time so paging
+    through a list doesn't run SELECT COUNT(*) on every request.
+    """
+
+    def __init__(self, object_list, per_page, cache_key, timeout=LIST_COUNT_CACHE_TIMEOUT, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+        self.timeout = timeout
+
+    @cached_property
+    def count(self):
+        return cache.get_or_set(
+            self.cache_key,
+            lambda: Paginator.count.func(self),
+            self.timeout
+        )
@@ -1,34 +1,52 @@
+import logging
+
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.core.paginator import Paginator
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.conf import settings
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Prefetch
 from django.utils import timezone
 from .models import Event
 from .forms import EventForm
+from .utils import (
+    EVENT_FULLTEXT_COLUMNS, CachedCountPaginator, cache_page_for_anonymous,
+    fulltext_search, get_list_count_cache_key, get_published_cities,
+)
+from .tasks import send_event_created_task, send_event_updated_task
 from rsvp.models import RSVP
+from notifications.tasks import run_in_background
+
+
+logger = logging.getLogger(__name__)
 
 
+@cache_page_for_anonymous()
 def event_list(request):
     """
     Display list of all published events.
     Includes pagination and search/filtering.
     """
+    # Only load the columns the event cards render
     events = Event.objects.filter(
         status='published'
-    ).select_related('organizer').order_by('start_date')
+    ).only(
+        'id', 'slug', 'title', 'start_date', 'city', 'state', 'event_type',
+        'banner_image', 'banner_thumbnail', 'total_seats', 'available_seats'
+    ).order_by('start_date')
     
     # Search functionality
     search_query = request.GET.get('search', '')
     if search_query:
-        events = events.filter(
-            Q(title__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(city__icontains=search_query)
-        )
+        matched = fulltext_search(events, EVENT_FULLTEXT_COLUMNS, search_query)
+        if matched is not None:
+            events = matched
+        else:
+            events = events.filter(
+                Q(title__icontains=search_query) |
+                Q(description__icontains=search_query) |
+                Q(venue_name__icontains=search_query) |
+                Q(city__icontains=search_query)
+            )
     
     # Filter by event type
     event_type = request.GET.get('type', '')
@@ -42,18 +60,20 @@ def event_list(request):
     
     # Filter upcoming/past events
     filter_time = request.GET.get('filter', '')
+    now = timezone.now()
     if filter_time == 'upcoming':
-        events = events.filter(start_date__gte=timezone.now())
+        events = events.filter(start_date__gte=now)
     elif filter_time == 'past':
-        events = events.filter(end_date__lt=timezone.now())
+        events = events.filter(end_date__lt=now)
     
     # Get unique cities for filter dropdown
-    cities = Event.objects.filter(
-        status='published'
-    ).values_list('city', flat=True).distinct().order_by('city')
+    cities = get_published_cities()
     
     # Pagination
-    paginator = Paginator(events, 9)  # Show 9 events per page
+    paginator = CachedCountPaginator(
+        events, 9,  # Show 9 events per page
+        cache_key=get_list_count_cache_key('events:list', request.GET)
+    )
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
@@ -69,38 +89,37 @@ def event_list(request):
     return render(request, 'events/event_list.html', context)
 
 
+@cache_page_for_anonymous(slug_kwarg='slug')
 def event_detail(request, slug):
     """
     Display detailed information about a specific event.
     Shows event details, organizer info, and RSVP status.
     """
-    event = get_object_or_404(
-        Event.objects.select_related('organizer'),
-        slug=slug
+    events = Event.objects.select_related('organizer', 'organizer__profile').annotate(
+        confirmed_count=Count('rsvps', filter=Q(rsvps__status='confirmed'))
     )
+    # Load the current user's RSVP (if any) alongside the event
+    if request.user.is_authenticated:
+        events = events.prefetch_related(Prefetch(
+            'rsvps',
+            queryset=RSVP.objects.filter(user=request.user),
+            to_attr='user_rsvps'
+        ))
+    event = get_object_or_404(events, slug=slug)
     
     # Check if user has RSVP'd to this event
     user_rsvp = None
-    if request.user.is_authenticated:
-        user_rsvp = RSVP.objects.filter(
-            event=event, 
-            user=request.user  # ✅ Changed from attendee to user
-        ).first()
+    if request.user.is_authenticated and event.user_rsvps:
+        user_rsvp = event.user_rsvps[0]
     
     # Check if event is full
     is_full = event.available_seats <= 0
     
-    # Get registration count
-    registration_count = RSVP.objects.filter(
-        event=event,
-        status='confirmed'  # ✅ Changed from payment_status to status
-    ).count()
-    
     context = {
         'event': event,
         'user_rsvp': user_rsvp,
         'is_full': is_full,
-        'registration_count': registration_count,
+        'registration_count': event.confirmed_count,
         'title': event.title
     }
     return render(request, 'events/event_detail.html', context)
@@ -124,11 +143,10 @@ def event_create(request):
                 f'Event "{event.title}" created successfully!'
             )
             
-            # Send notification email (optional - fails silently)
-            try:
-                send_event_created_notification(event, request)
-            except Exception as e:
-                print(f"Failed to send event creation notification: {e}")
+            # Send notification email in the background (fails silently)
+            run_in_background(
+                send_event_created_task, event.id, request.get_host()
+            )
             
             return redirect('events:event_detail', slug=event.slug)
         else:
@@ -170,7 +188,10 @@ def event_update(request, slug):
     if request.method == 'POST':
         form = EventForm(request.POST, request.FILES, instance=event)
         if form.is_valid():
-            updated_event = form.save()
+            updated_event = form.save(commit=False)
+            # Write only the edited columns; the RSVP/check-in counters are
+            # kept current by their own UPDATEs and the loaded values may be stale
+            updated_event.save(update_fields=[*EventForm.Meta.fields, 'banner_thumbnail', 'updated_at'])
             
             messages.success(
                 request, 
@@ -191,9 +212,12 @@ def event_update(request, slug):
                     changes.append(f"Price changed to ${updated_event.ticket_price}")
                 
                 if changes:
-                    send_event_updated_notification(updated_event, changes, request)
+                    run_in_background(
+                        send_event_updated_task,
+                        updated_event.id, changes, request.get_host()
+                    )
             except Exception as e:
-                print(f"Failed to send event update notification: {e}")
+                logger.exception("Failed to send event update notification: %s", e)
             
             return redirect('events:event_detail', slug=updated_event.slug)
         else:
@@ -298,78 +322,3 @@ def my_events(request):
         'title': 'My Events'
     }
     return render(request, 'events/my_events.html', context)
-
-
-# Helper Functions for Email Notifications
-
-def send_event_created_notification(event, request):
-    """Send notification when event is created"""
-    try:
-        context = {
-            'event': event,
-            'domain': request.get_host(),
-        }
-        
-        subject = f'Event Created: {event.title}'
-        html_message = render_to_string(
-            'notifications/emails/event_created.html', 
-            context
-        )
-        plain_message = render_to_string(
-            'notifications/emails/event_created.txt', 
-            context
-        )
-        
-        send_mail(
-            subject,
-            plain_message,
-            settings.DEFAULT_FROM_EMAIL,
-            [event.organizer.email],
-            html_message=html_message,
-            fail_silently=True,
-        )
-    except Exception as e:
-        print(f"Error sending event created notification: {e}")
-
-
-def send_event_updated_notification(event, changes, request):
-    """Send notification to attendees when event is updated"""
-    try:
-        # Get all confirmed attendees
-        confirmed_rsvps = RSVP.objects.filter(
-            event=event,
-            status='confirmed'  # ✅ Changed from payment_status to status
-        ).select_related('user')  # ✅ Changed from attendee to user
-        
-        for rsvp in confirmed_rsvps:
-            try:
-                context = {
-                    'event': event,
-                    'attendee': rsvp.user,  # ✅ Changed from rsvp.attendee to rsvp.user
-                    'changes': changes,
-                    'domain': request.get_host(),
-                }
-                
-                subject = f'Event Updated - {event.title}'
-                html_message = render_to_string(
-                    'notifications/emails/event_updated.html', 
-                    context
-                )
-                plain_message = render_to_string(
-                    'notifications/emails/event_updated.txt', 
-                    context
-                )
-                
-                send_mail(
-                    subject,
-                    plain_message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [rsvp.user.email],  # ✅ Changed from rsvp.attendee.email
-                    html_message=html_message,
-                    fail_silently=True,
-                )
-            except Exception as e:
-                print(f"Failed to notify {rsvp.user.email}: {e}")
-                
-    except Exception as e:
-        print(f"Error sending event update notifications: {e}")
\ No newline at end of file
@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.core.mail import get_connection
+
+# Messages handed to the SMTP connection per send_messages() call
+EMAIL_BATCH_SIZE = 50
+# Messages sent over one SMTP connection before it is closed and reopened
+MAX_MESSAGES_PER_CONNECTION = getattr(settings, 'EMAIL_MAX_MESSAGES_PER_CONNECTION', 100)
+
+
+def send_batch(connection, batch):
+    """Send a batch of messages over an open connection; returns how many went out"""
+    if not batch:
+        return 0
+    return connection.send_messages(batch) or 0
+
+
+class PooledSender:
+    """
+    Queue messages and deliver them in batches over a reused SMTP connection.
+    The connection is recycled after `max_messages` so provider limits on
+    messages per connection (and idle timeouts) are never hit.
+
+    Use as a context manager; anything still queued is sent on exit.
+    """
+
+    def __init__(self, batch_size=EMAIL_BATCH_SIZE, max_messages=MAX_MESSAGES_PER_CONNECTION):
+        self.batch_size = batch_size
+        self.max_messages = max_messages
+        self.connection = None
+        self.connection_count = 0
+        self.batch = []
+        self.sent = 0
+        self.failed = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self.flush()
+        finally:
+            self.close()
+
+    def send(self, message):
+        """Queue a message, flushing once a full batch is waiting"""
+        self.batch.append(message)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Send whatever is queued"""
+        if not self.batch:
+            return
+        if self.connection is None:
+            self.connection = get_connection(fail_silently=True)
+            self.connection.open()
+
+        sent = send_batch(self.connection, self.batch)
+        self.sent += sent
+        self.failed += len(self.batch) - sent
+        self.connection_count += len(self.batch)
+        self.batch = []
+
+        if self.connection_count >= self.max_messages:
+            self.close()
+
+    def close(self):
+        """Close the current connection; the next flush opens a new one"""
+        if self.connection is not None:
+            self.connection.close()
+        self.connection = None
+        self.connection_count = 0
@@ -31,4 +31,9 @@ class Notification(models.Model):
     
     class Meta:
         db_table = 'notifications'
-        ordering = ['-sent_at']
\ No newline at end of file
+        ordering = ['-sent_at']
+        indexes = [
+            models.Index(fields=['-sent_at'], name='notif_sent_idx'),
+            models.Index(fields=['recipient', 'is_read'], name='notif_recipient_read_idx'),
+            models.Index(fields=['notification_type', 'sent_at'], name='notif_type_sent_idx'),
+        ]
\ No newline at end of file
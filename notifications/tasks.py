@@ -0,0 +1,80 @@
+"""
+Background notification tasks.
+
+The project has no task queue, so emails are handed to a small
+process-local thread pool once the current transaction commits. Tasks
+take primary keys rather than model instances and reload what they need.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections, transaction
+
+from events.models import Event
+from .utils import send_bulk_notification
+
+
+logger = logging.getLogger(__name__)
+
+executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notification-tasks')
+
+# An aborted bulk send retries its unsent recipients this many times,
+# waiting BULK_RETRY_DELAY seconds and doubling the wait after each attempt
+BULK_RETRY_ATTEMPTS = 3
+BULK_RETRY_DELAY = 60
+
+
+def run_in_background(func, *args):
+    """Run func(*args) on the worker pool after the transaction commits"""
+    def task():
+        # Worker threads get their own DB connection; don't let it go stale
+        close_old_connections()
+        try:
+            func(*args)
+        except Exception as e:
+            logger.exception("Background task %s failed: %s", func.__name__, e)
+        finally:
+            close_old_connections()
+
+    transaction.on_commit(lambda: executor.submit(task))
+
+
+def send_bulk_notification_task(event_id, subject, message, rsvp_ids=None, attempt=0):
+    """
+    Load the event and message all of its confirmed attendees (or only
+    rsvp_ids, on a retry). Recipients left unsent by an abort are retried
+    with backoff; once the retries run out they are logged, never dropped silently.
+    """
+    event = Event.objects.select_related('organizer').filter(id=event_id).first()
+    if event is None:
+        return
+    
+    result = send_bulk_notification(event, subject, message, rsvp_ids)
+    unsent_ids = result['unsent_ids']
+    if not unsent_ids:
+        if result['fail_count']:
+            logger.warning(
+                "Bulk send for event %s: %s sent, %s failed",
+                event_id, result['success_count'], result['fail_count']
+            )
+        return
+    
+    if attempt >= BULK_RETRY_ATTEMPTS:
+        logger.error(
+            "Giving up on bulk send for event %s after %s retries; %s recipients not notified: %s",
+            event_id, attempt, len(unsent_ids), unsent_ids
+        )
+        return
+    
+    delay = BULK_RETRY_DELAY * 2 ** attempt
+    logger.error(
+        "Bulk send for event %s aborted; retrying %s unsent recipients in %s seconds",
+        event_id, len(unsent_ids), delay
+    )
+    retry = threading.Timer(
+        delay, run_in_background,
+        (send_bulk_notification_task, event_id, subject, message, unsent_ids, attempt + 1)
+    )
+    retry.daemon = True
+    retry.start()
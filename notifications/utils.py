@@ -1,215 +1,151 @@
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+import logging
+import queue
+import threading
+from functools import partial
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.mail import EmailMultiAlternatives
+from django.template.loader import get_template
 from django.conf import settings
 from rsvp.models import RSVP
+from .mailer import EMAIL_BATCH_SIZE, PooledSender
+
+logger = logging.getLogger(__name__)
+
+# Attendee rows fetched from the database cursor at a time
+ATTENDEE_CHUNK_SIZE = 500
+# The only RSVP/User columns the attendee email templates read
+ATTENDEE_FIELDS = ('id', 'ticket_number', 'user__username', 'user__email')
+# Parallel SMTP connections used by send_bulk_notification
+EMAIL_SEND_WORKERS = getattr(settings, 'EMAIL_SEND_WORKERS', 4)
+# Attendees waiting for a free worker; rows are only fetched this far ahead
+SEND_QUEUE_SIZE = EMAIL_SEND_WORKERS * EMAIL_BATCH_SIZE * 2
+# Domain used to build links in the emails, read from settings once
+SITE_DOMAIN = getattr(settings, 'SITE_DOMAIN', 'localhost:8000')
+# Stop a bulk send once more than this share of a worker's messages failed...
+BATCH_ABORT_RATIO = 1 / 3
+# ...but only after at least this many outcomes are known
+MIN_ABORT_BATCH = 30
+
 
+def provider_failing(sent, failed):
+    """True once the failure rate says the SMTP provider is down"""
+    attempted = sent + failed
+    return attempted >= MIN_ABORT_BATCH and failed / attempted > BATCH_ABORT_RATIO
 
-def send_bulk_notification(event, subject, message):
+
+def send_bulk_notification(event, subject, message, rsvp_ids=None):
     """
     Send bulk notification to all confirmed attendees of an event
+    (only the given RSVPs when retrying a send that was aborted)
     """
-    from django.contrib.sites.shortcuts import get_current_site
-    from django.http import HttpRequest
-    
     # Get all confirmed attendees
     attendees = RSVP.objects.filter(
         event=event,
         status='confirmed'
-    ).select_related('user')
+    ).select_related('user').only(*ATTENDEE_FIELDS)
+    if rsvp_ids is not None:
+        attendees = attendees.filter(id__in=rsvp_ids)
+    
+    # Nothing to send: skip template lookups and the sender pool entirely
+    rows = attendees.iterator(chunk_size=ATTENDEE_CHUNK_SIZE)
+    first_rsvp = next(rows, None)
+    if first_rsvp is None:
+        return {
+            'success_count': 0,
+            'fail_count': 0,
+            'total_sent': 0,
+            'total_failed': 0,
+            'aborted': False,
+            'unsent_ids': [],
+        }
+    
+    # Look the templates up once; only the per-attendee render is repeated
+    html_template = get_template('notifications/emails/bulk_notification.html')
+    plain_template = get_template('notifications/emails/bulk_notification.txt')
+    
+    # Everything except the attendee is shared by all messages
+    email_subject = f'{subject} - {event.title}'
+    make_email = partial(
+        EmailMultiAlternatives, email_subject, from_email=settings.DEFAULT_FROM_EMAIL
+    )
+    base_context = {
+        'event': event,
+        'subject': subject,
+        'message': message,
+        'domain': SITE_DOMAIN,
+    }
+    
+    # Attendees are handed to the workers through a bounded queue, so rows
+    # are fetched and rendered only as fast as they can be sent
+    pending = queue.Queue(maxsize=SEND_QUEUE_SIZE)
+    abort = threading.Event()
+    
+    def send_shard():
+        """One worker: send queued attendees over its own pooled connection"""
+        render_failures = 0
+        unsent_ids = []
+        with PooledSender() as sender:
+            while (rsvp := pending.get()) is not None:
+                if abort.is_set():
+                    unsent_ids.append(rsvp.id)
+                    continue
+                try:
+                    context = base_context | {'rsvp': rsvp, 'attendee': rsvp.user}
+                    
+                    # Render HTML and plain text email
+                    html_message = html_template.render(context)
+                    plain_message = plain_template.render(context)
+                    
+                    email = make_email(plain_message, to=[rsvp.user.email])
+                    email.attach_alternative(html_message, 'text/html')
+                    sender.send(email)
+                    
+                except Exception as e:
+                    logger.warning("Failed to send notification to %s: %s", rsvp.user.email, e)
+                    render_failures += 1
+                
+                if provider_failing(sender.sent, sender.failed + render_failures):
+                    abort.set()
+        return sender.sent, sender.failed + render_failures, unsent_ids
+    
+    unsent_ids = []
+    with ThreadPoolExecutor(max_workers=EMAIL_SEND_WORKERS) as pool:
+        shards = [pool.submit(send_shard) for _ in range(EMAIL_SEND_WORKERS)]
+        for rsvp in chain([first_rsvp], rows):
+            # Once aborted, the rest are only collected so they can be retried
+            if abort.is_set():
+                unsent_ids.append(rsvp.id)
+            else:
+                pending.put(rsvp)
+        # One end marker per worker
+        for _ in shards:
+            pending.put(None)
     
     success_count = 0
     fail_count = 0
+    for shard in shards:
+        shard_sent, shard_failed, shard_unsent = shard.result()
+        success_count += shard_sent
+        fail_count += shard_failed
+        unsent_ids += shard_unsent
     
-    # Create a dummy request object for domain (if needed)
-    domain = getattr(settings, 'SITE_DOMAIN', 'localhost:8000')
-    
-    for rsvp in attendees:
-        try:
-            context = {
-                'rsvp': rsvp,
-                'event': event,
-                'attendee': rsvp.user,
-                'subject': subject,
-                'message': message,
-                'domain': domain,
-            }
-            
-            email_subject = f'{subject} - {event.title}'
-            
-            # Render HTML email
-            html_message = render_to_string(
-                'notifications/emails/bulk_notification.html',
-                context
-            )
-            
-            # Render plain text email
-            plain_message = render_to_string(
-                'notifications/emails/bulk_notification.txt',
-                context
-            )
-            
-            # Send email
-            send_mail(
-                email_subject,
-                plain_message,
-                settings.DEFAULT_FROM_EMAIL,
-                [rsvp.user.email],
-                html_message=html_message,
-                fail_silently=True,
-            )
-            
-            success_count += 1
-            
-        except Exception as e:
-            print(f"Failed to send notification to {rsvp.user.email}: {e}")
-            fail_count += 1
+    aborted = abort.is_set()
+    if aborted:
+        logger.error(
+            "Aborted bulk send for event %s, failure rate too high "
+            "(%s sent, %s failed, %s not attempted)",
+            event.id, success_count, fail_count, len(unsent_ids)
+        )
     
+    # Recipients that were never attempted count as failed too
+    fail_count += len(unsent_ids)
     return {
         'success_count': success_count,
         'fail_count': fail_count,
         'total_sent': success_count,
-        'total_failed': fail_count
+        'total_failed': fail_count,
+        'aborted': aborted,
+        'unsent_ids': unsent_ids,
     }
-
-
-def send_event_notification(event, notification_type):
-    """
-    Send event-related notifications (created, updated, cancelled)
-    This is called when organizer creates/updates/cancels events
-    """
-    from django.contrib.sites.shortcuts import get_current_site
-    
-    domain = getattr(settings, 'SITE_DOMAIN', 'localhost:8000')
-    
-    if notification_type == 'created':
-        # Notify organizer that event was created
-        try:
-            context = {
-                'event': event,
-                'domain': domain,
-            }
-            
-            subject = f'Event Created: {event.title}'
-            html_message = render_to_string(
-                'notifications/emails/event_created.html',
-                context
-            )
-            plain_message = render_to_string(
-                'notifications/emails/event_created.txt',
-                context
-            )
-            
-            send_mail(
-                subject,
-                plain_message,
-                settings.DEFAULT_FROM_EMAIL,
-                [event.organizer.email],
-                html_message=html_message,
-                fail_silently=True,
-            )
-        except Exception as e:
-            print(f"Failed to send event creation notification: {e}")
-    
-    elif notification_type == 'updated':
-        # Notify all attendees that event was updated
-        attendees = RSVP.objects.filter(
-            event=event,
-            status='confirmed'
-        ).select_related('user')
-        
-        for rsvp in attendees:
-            try:
-                context = {
-                    'event': event,
-                    'attendee': rsvp.user,
-                    'rsvp': rsvp,
-                    'domain': domain,
-                    'changes': ['Event details have been updated'],
-                }
-                
-                subject = f'Event Updated - {event.title}'
-                html_message = render_to_string(
-                    'notifications/emails/event_updated.html',
-                    context
-                )
-                plain_message = render_to_string(
-                    'notifications/emails/event_updated.txt',
-                    context
-                )
-                
-                send_mail(
-                    subject,
-                    plain_message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [rsvp.user.email],
-                    html_message=html_message,
-                    fail_silently=True,
-                )
-            except Exception as e:
-                print(f"Failed to send update notification to {rsvp.user.email}: {e}")
-
-
-def send_rsvp_notification(rsvp, notification_type):
-    """
-    Send RSVP-related notifications (created, cancelled)
-    """
-    domain = getattr(settings, 'SITE_DOMAIN', 'localhost:8000')
-    
-    if notification_type == 'created':
-        # Send confirmation to attendee
-        try:
-            context = {
-                'rsvp': rsvp,
-                'domain': domain,
-            }
-            
-            subject = f'Registration Confirmed - {rsvp.event.title}'
-            html_message = render_to_string(
-                'notifications/emails/rsvp_confirmed.html',
-                context
-            )
-            plain_message = render_to_string(
-                'notifications/emails/rsvp_confirmed.txt',
-                context
-            )
-            
-            send_mail(
-                subject,
-                plain_message,
-                settings.DEFAULT_FROM_EMAIL,
-                [rsvp.user.email],
-                html_message=html_message,
-                fail_silently=True,
-            )
-        except Exception as e:
-            print(f"Failed to send RSVP confirmation: {e}")
-    
-    elif notification_type == 'cancelled':
-        # Send cancellation notice
-        try:
-            context = {
-                'rsvp': rsvp,
-                'domain': domain,
-                'refund_info': rsvp.event.ticket_price > 0,
-            }
-            
-            subject = f'Registration Cancelled - {rsvp.event.title}'
-            html_message = render_to_string(
-                'notifications/emails/rsvp_cancelled.html',
-                context
-            )
-            plain_message = render_to_string(
-                'notifications/emails/rsvp_cancelled.txt',
-                context
-            )
-            
-            send_mail(
-                subject,
-                plain_message,
-                settings.DEFAULT_FROM_EMAIL,
-                [rsvp.user.email],
-                html_message=html_message,
-                fail_silently=True,
-            )
-        except Exception as e:
-            print(f"Failed to send cancellation notification: {e}")
\ No newline at end of file
@@ -1,25 +1,27 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.db.models import Count, Q
 from events.models import Event
-from rsvp.models import RSVP
-from .utils import send_bulk_notification
+from .tasks import run_in_background, send_bulk_notification_task
 
 
 @login_required
 def send_event_notification(request, event_slug):
-    event = get_object_or_404(Event, slug=event_slug)
+    # Fetch the event together with its confirmed attendee count
+    event = get_object_or_404(
+        Event.objects.annotate(
+            confirmed_count=Count('rsvps', filter=Q(rsvps__status='confirmed'))
+        ),
+        slug=event_slug
+    )
     
     # Check permission
-    if event.organizer != request.user:
+    if event.organizer_id != request.user.id:
         messages.error(request, 'You do not have permission to send notifications.')
         return redirect('events:event_detail', slug=event_slug)
     
-    # Get attendee count
-    attendees_count = RSVP.objects.filter(
-        event=event,
-        status='confirmed'
-    ).count()
+    attendees_count = event.confirmed_count
     
     if request.method == 'POST':
         subject = request.POST.get('subject', '').strip()
@@ -28,23 +30,14 @@ def send_event_notification(request, event_slug):
         if not subject or not message:
             messages.error(request, 'Please provide both subject and message.')
         else:
-            # Send notifications
-            result = send_bulk_notification(event, subject, message)
-            
-            # Show results
-            if result['success_count'] > 0:
+            # Send notifications in the background
+            if attendees_count > 0:
+                run_in_background(send_bulk_notification_task, event.id, subject, message)
                 messages.success(
                     request, 
-                    f'✅ Notification sent to {result["success_count"]} attendee(s)!'
-                )
-            
-            if result['fail_count'] > 0:
-                messages.warning(
-                    request,
-                    f'⚠️ Failed to send to {result["fail_count"]} attendee(s).'
+                    f'✅ Notification is being sent to {attendees_count} attendee(s)!'
                 )
-            
-            if result['success_count'] == 0 and result['fail_count'] == 0:
+            else:
                 messages.info(request, 'No attendees to notify.')
             
             return redirect('rsvp:event_attendees', event_slug=event_slug)
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rsvp', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rsvp',
+            index=models.Index(fields=['event', 'status'], name='rsvp_event_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='rsvp',
+            index=models.Index(fields=['status', 'created_at'], name='rsvp_status_created_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rsvp', '0002_add_rsvp_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rsvp',
+            name='ticket_pdf',
+            field=models.FileField(blank=True, null=True, upload_to='tickets/'),
+        ),
+        migrations.AddField(
+            model_name='rsvp',
+            name='ticket_pdf_generated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-14 03:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rsvp', '0003_rsvp_ticket_pdf'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='rsvp',
+            index=models.Index(fields=['user', 'status'], name='rsvp_user_status_idx'),
+        ),
+    ]
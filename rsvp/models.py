@@ -1,6 +1,12 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.utils import timezone
 from events.models import Event
+from dashboard.utils import invalidate_analytics_cache
 import uuid
 import qrcode
 from io import BytesIO
@@ -31,6 +37,8 @@ class RSVP(models.Model):
     # Ticket Information
     ticket_number = models.CharField(max_length=100, unique=True, blank=True)
     qr_code = models.ImageField(upload_to='qr_codes/', blank=True, null=True)
+    ticket_pdf = models.FileField(upload_to='tickets/', blank=True, null=True)
+    ticket_pdf_generated_at = models.DateTimeField(null=True, blank=True)
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -41,16 +49,12 @@ class RSVP(models.Model):
     notes = models.TextField(blank=True, null=True, help_text="Special requests or notes")
     
     def save(self, *args, **kwargs):
-        """Generate ticket number and QR code on creation"""
+        """Generate ticket number on creation"""
         if not self.ticket_number:
             # Generate unique ticket number
             self.ticket_number = f"TKT-{uuid.uuid4().hex[:12].upper()}"
         
         super().save(*args, **kwargs)
-        
-        # Generate QR code if not exists
-        if not self.qr_code:
-            self.generate_qr_code()
     
     def generate_qr_code(self):
         """Generate QR code for ticket"""
@@ -59,10 +63,12 @@ class RSVP(models.Model):
             error_correction=qrcode.constants.ERROR_CORRECT_L,
             box_size=10,
             border=4,
+            # Fixed mask: skips scoring all eight patterns (most of the encode time)
+            mask_pattern=0,
         )
         
         # QR code data includes ticket number and event info
-        qr_data = f"TICKET:{self.ticket_number}|EVENT:{self.event.id}|USER:{self.user.id}"
+        qr_data = f"TICKET:{self.ticket_number}|EVENT:{self.event_id}|USER:{self.user_id}"
         qr.add_data(qr_data)
         qr.make(fit=True)
         
@@ -80,22 +86,34 @@ class RSVP(models.Model):
     
     def confirm(self):
         """Confirm RSVP"""
-        from django.utils import timezone
         self.status = 'confirmed'
         self.confirmed_at = timezone.now()
-        self.save()
+        # Only the status columns, so a QR code/ticket written meanwhile is kept
+        self.save(update_fields=['status', 'confirmed_at', 'updated_at'])
     
     def cancel(self):
-        """Cancel RSVP and restore event seats"""
+        """
+        Cancel RSVP and restore event seats.
+        The status UPDATE only matches an active RSVP, so seats are released
+        once even if two cancel requests race.
+        """
+        with transaction.atomic():
+            cancelled = RSVP.objects.filter(pk=self.pk).exclude(
+                status='cancelled'
+            ).update(status='cancelled', updated_at=timezone.now())
+            if cancelled:
+                self.event.release_seat(self.number_of_tickets)
+                refresh_event_rsvp_count(self.event_id)
+                # update() sends no post_save, so drop the analytics it would
+                # have; release_seat() already invalidated the cached pages
+                invalidate_analytics_cache(self.event.organizer_id)
         self.status = 'cancelled'
-        self.event.available_seats += self.number_of_tickets
-        self.event.save()
-        self.save()
+        return cancelled == 1
     
     def mark_attended(self):
         """Mark as attended during check-in"""
         self.status = 'attended'
-        self.save()
+        self.save(update_fields=['status', 'updated_at'])
     
     def __str__(self):
         return f"{self.user.username} - {self.event.title} ({self.ticket_number})"
@@ -105,4 +123,38 @@ class RSVP(models.Model):
         unique_together = ['event', 'user']
         ordering = ['-created_at']
         verbose_name = 'RSVP'
-        verbose_name_plural = 'RSVPs'
\ No newline at end of file
+        verbose_name_plural = 'RSVPs'
+        indexes = [
+            models.Index(fields=['event', 'status'], name='rsvp_event_status_idx'),
+            models.Index(fields=['status', 'created_at'], name='rsvp_status_created_idx'),
+            models.Index(fields=['user', 'status'], name='rsvp_user_status_idx'),
+        ]
+
+
+def refresh_event_rsvp_count(event_id):
+    """Recalculate Event.total_rsvps (non-cancelled RSVPs) in a single UPDATE"""
+    active_rsvps = RSVP.objects.filter(
+        event=OuterRef('pk')
+    ).exclude(
+        status='cancelled'
+    ).order_by().values('event').annotate(
+        count=Count('id')
+    ).values('count')
+    
+    Event.objects.filter(pk=event_id).update(
+        total_rsvps=Coalesce(Subquery(active_rsvps), 0)
+    )
+
+# Signals to keep the event's RSVP counter up to date
+@receiver(post_save, sender=RSVP)
+def update_event_rsvp_count_on_save(sender, instance, **kwargs):
+    """Refresh counter when an RSVP is created or its status may have changed"""
+    update_fields = kwargs.get('update_fields')
+    if update_fields and 'status' not in update_fields:
+        return
+    refresh_event_rsvp_count(instance.event_id)
+
+@receiver(post_delete, sender=RSVP)
+def update_event_rsvp_count_on_delete(sender, instance, **kwargs):
+    """Refresh counter when an RSVP is deleted"""
+    refresh_event_rsvp_count(instance.event_id)
@@ -0,0 +1,170 @@
+"""
+Background tasks for RSVPs.
+
+Tasks take primary keys rather than model instances and reload what they
+need; they are scheduled with notifications.tasks.run_in_background.
+"""
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, send_mail
+from django.db.models import Sum
+from django.template.loader import render_to_string
+
+from .models import RSVP
+from notifications.mailer import PooledSender
+
+
+logger = logging.getLogger(__name__)
+
+
+def generate_qr_code_task(rsvp_id):
+    """Load the RSVP and render its ticket QR code if it still has none"""
+    rsvp = RSVP.objects.filter(id=rsvp_id).only('id', 'ticket_number', 'event', 'user', 'qr_code').first()
+    if rsvp is not None and not rsvp.qr_code:
+        rsvp.generate_qr_code()
+
+
+def load_rsvp_for_email(rsvp_id):
+    """The RSVP with everything the email templates read, or None if it's gone"""
+    return RSVP.objects.select_related('event__organizer', 'user').filter(id=rsvp_id).first()
+
+
+def send_rsvp_confirmation_task(rsvp_id, domain):
+    """Load the RSVP and send the attendee their confirmation"""
+    rsvp = load_rsvp_for_email(rsvp_id)
+    if rsvp is not None:
+        send_rsvp_confirmation_email(rsvp, domain)
+
+
+def send_organizer_notification_task(rsvp_id, domain):
+    """Load the RSVP and tell the organizer about the new registration"""
+    rsvp = load_rsvp_for_email(rsvp_id)
+    if rsvp is not None:
+        send_organizer_notification_email(rsvp, domain)
+
+
+def send_rsvp_cancellation_task(rsvp_id, domain):
+    """Load the RSVP and send the attendee their cancellation notice"""
+    rsvp = load_rsvp_for_email(rsvp_id)
+    if rsvp is not None:
+        send_rsvp_cancellation_email(rsvp, domain)
+
+
+# Helper Functions for Email Notifications
+
+def send_rsvp_confirmation_email(rsvp, domain):
+    """Send confirmation email to attendee when RSVP is created"""
+    try:
+        context = {
+            'rsvp': rsvp,
+            'domain': domain,
+        }
+        
+        subject = f'Registration Confirmed - {rsvp.event.title}'
+        html_message = render_to_string(
+            'notifications/emails/rsvp_confirmed.html', 
+            context
+        )
+        plain_message = render_to_string(
+            'notifications/emails/rsvp_confirmed.txt', 
+            context
+        )
+        
+        send_mail(
+            subject,
+            plain_message,
+            settings.DEFAULT_FROM_EMAIL,
+            [rsvp.user.email],
+            html_message=html_message,
+            fail_silently=True,
+        )
+    except Exception as e:
+        logger.warning("Error sending RSVP confirmation email: %s", e)
+
+
+def send_organizer_notification_email(rsvp, domain):
+    """Send notification to event organizer when someone registers"""
+    try:
+        event = rsvp.event
+        
+        # Calculate statistics
+        total_registrations = RSVP.objects.filter(
+            event=event
+        ).exclude(status='cancelled').count()
+        
+        total_tickets = RSVP.objects.filter(
+            event=event
+        ).exclude(status='cancelled').aggregate(
+            total=Sum('number_of_tickets')
+        )['total'] or 0
+        
+        booking_percentage = (total_tickets / event.total_seats * 100) if event.total_seats > 0 else 0
+        
+        # Calculate revenue for paid events
+        revenue = rsvp.number_of_tickets * float(event.ticket_price) if event.event_type == 'paid' else 0
+        total_revenue = total_tickets * float(event.ticket_price) if event.event_type == 'paid' else 0
+        
+        context = {
+            'rsvp': rsvp,
+            'event': event,
+            'organizer': event.organizer,
+            'domain': domain,
+            'total_registrations': total_registrations,
+            'total_tickets': total_tickets,
+            'booking_percentage': booking_percentage,
+            'revenue': revenue,
+            'total_revenue': total_revenue,
+        }
+        
+        subject = f'New Registration for {event.title}'
+        html_message = render_to_string(
+            'notifications/emails/new_registration_organizer.html', 
+            context
+        )
+        plain_message = render_to_string(
+            'notifications/emails/new_registration_organizer.txt', 
+            context
+        )
+        
+        send_mail(
+            subject,
+            plain_message,
+            settings.DEFAULT_FROM_EMAIL,
+            [event.organizer.email],
+            html_message=html_message,
+            fail_silently=True,
+        )
+    except Exception as e:
+        logger.warning("Error sending organizer notification email: %s", e)
+
+
+def send_rsvp_cancellation_email(rsvp, domain):
+    """Send notification email when RSVP is cancelled; returns (sent, failed)"""
+    try:
+        context = {
+            'rsvp': rsvp,
+            'domain': domain,
+            'refund_info': rsvp.event.ticket_price > 0,
+        }
+        
+        subject = f'Registration Cancelled - {rsvp.event.title}'
+        html_message = render_to_string(
+            'notifications/emails/rsvp_cancelled.html', 
+            context
+        )
+        plain_message = render_to_string(
+            'notifications/emails/rsvp_cancelled.txt', 
+            context
+        )
+        
+        email = EmailMultiAlternatives(
+            subject, plain_message, settings.DEFAULT_FROM_EMAIL, [rsvp.user.email]
+        )
+        email.attach_alternative(html_message, 'text/html')
+        with PooledSender() as sender:
+            sender.send(email)
+        return sender.sent, sender.failed
+    except Exception as e:
+        logger.warning("Error sending RSVP cancellation email: %s", e)
+        return 0, 1
@@ -11,4 +11,5 @@ urlpatterns = [
     path('<int:rsvp_id>/cancel/', views.cancel_rsvp, name='cancel_rsvp'),
     path('<int:rsvp_id>/download-ticket/', views.download_ticket, name='download_ticket'),
     path('event/<slug:event_slug>/attendees/', views.event_attendees, name='event_attendees'),
+    path('event/<slug:event_slug>/attendees/export/', views.export_attendees_csv, name='export_attendees_csv'),
 ]
\ No newline at end of file
@@ -1,20 +1,30 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import HttpResponse
+from django.core.paginator import Paginator
+from django.http import FileResponse, StreamingHttpResponse
 from django.utils import timezone
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
-from django.conf import settings
-from django.db.models import Sum
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Count, Q, Sum
 from .models import RSVP
 from .forms import RSVPForm
+from .tasks import (
+    generate_qr_code_task, send_organizer_notification_task,
+    send_rsvp_cancellation_task, send_rsvp_confirmation_task,
+)
 from events.models import Event
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.utils import ImageReader
 from io import BytesIO
-import os
+import csv
+from notifications.tasks import run_in_background
+
+# Attendees shown per page on the organizer's attendee list
+ATTENDEES_PER_PAGE = 100
+# Rows fetched from the database cursor at a time for the CSV export
+ATTENDEE_EXPORT_CHUNK_SIZE = 1000
 
 
 # @login_required
@@ -111,16 +121,6 @@ def create_rsvp(request, event_slug):
         messages.warning(request, 'You have already registered for this event.')
         return redirect('rsvp:my_rsvps')
     
-    # Check if event is full
-    if event.is_full():
-        messages.error(request, 'Sorry, this event is fully booked.')
-        return redirect('events:event_detail', slug=event_slug)
-    
-    # Check if event has already started
-    if event.start_date < timezone.now():
-        messages.error(request, 'Registration is closed. This event has already started.')
-        return redirect('events:event_detail', slug=event_slug)
-    
     if request.method == 'POST':
         form = RSVPForm(request.POST, event=event)
         if form.is_valid():
@@ -138,42 +138,41 @@ def create_rsvp(request, event_slug):
                 rsvp.user = request.user
                 rsvp.status = 'confirmed'
             
-            # Check availability one more time
-            if rsvp.number_of_tickets > event.available_seats:
-                messages.error(request, f'Only {event.available_seats} seats remaining.')
-                return redirect('events:event_detail', slug=event_slug)
-            
-            # Update available seats
-            event.available_seats -= rsvp.number_of_tickets
-            event.save()
-            
-            # Save RSVP (either new or updated)
-            rsvp.save()
-            
-            # Confirm RSVP (this might generate new QR code)
-            rsvp.confirm()
+            with transaction.atomic():
+                # Take the seats in one conditional UPDATE that also checks the
+                # event is still open, so there is no check-then-act gap
+                if not event.reserve_seat(rsvp.number_of_tickets):
+                    messages.error(request, registration_closed_message(event))
+                    return redirect('events:event_detail', slug=event_slug)
+                
+                # Save RSVP (either new or updated), already confirmed
+                rsvp.confirmed_at = timezone.now()
+                if rsvp.pk:
+                    rsvp.save(update_fields=['status', 'number_of_tickets', 'confirmed_at', 'updated_at'])
+                else:
+                    rsvp.save()
             
             messages.success(
                 request, 
                 f'Successfully registered for {event.title}! Your ticket number is {rsvp.ticket_number}.'
             )
             
-            # Send confirmation to attendee (fails silently)
-            try:
-                send_rsvp_confirmation_email(rsvp, request)
-            except Exception as e:
-                print(f"Failed to send RSVP confirmation email: {e}")
-            
-            # Send notification to organizer (fails silently)
-            try:
-                send_organizer_notification_email(rsvp, request)
-            except Exception as e:
-                print(f"Failed to send organizer notification email: {e}")
+            # Email the attendee and the organizer after the response is sent
+            domain = request.get_host()
+            # New tickets get their QR code rendered off the request path
+            if not rsvp.qr_code:
+                run_in_background(generate_qr_code_task, rsvp.id)
+            run_in_background(send_rsvp_confirmation_task, rsvp.id, domain)
+            run_in_background(send_organizer_notification_task, rsvp.id, domain)
             
             return redirect('rsvp:rsvp_detail', rsvp_id=rsvp.id)
         else:
             messages.error(request, 'Please correct the errors below.')
     else:
+        # Don't offer the form when registration can't succeed
+        if event.is_full() or event.start_date < timezone.now():
+            messages.error(request, registration_closed_message(event, refresh=False))
+            return redirect('events:event_detail', slug=event_slug)
         form = RSVPForm(event=event)
     
     context = {
@@ -183,13 +182,31 @@ def create_rsvp(request, event_slug):
     }
     return render(request, 'rsvp/rsvp_form.html', context)
 
+def registration_closed_message(event, refresh=True):
+    """
+    Explain why seats couldn't be reserved. With refresh, the event row is
+    re-read first (only on the failure path) to see which condition failed.
+    """
+    if refresh:
+        event.refresh_from_db(fields=['status', 'start_date', 'available_seats'])
+    if event.start_date < timezone.now():
+        return 'Registration is closed. This event has already started.'
+    if event.status != 'published':
+        return 'Registration is closed for this event.'
+    if event.is_full():
+        return 'Sorry, this event is fully booked.'
+    return f'Only {event.available_seats} seats remaining.'
+
+
 @login_required
 def rsvp_detail(request, rsvp_id):
     """
     Display RSVP details and ticket information.
     Shows ticket number, QR code, and event details.
     """
-    rsvp = get_object_or_404(RSVP, id=rsvp_id, user=request.user)
+    rsvp = get_object_or_404(
+        RSVP.objects.select_related('event', 'user'), id=rsvp_id, user_id=request.user.id
+    )
     
     context = {
         'rsvp': rsvp,
@@ -204,26 +221,37 @@ def my_rsvps(request):
     Display all RSVPs for current user.
     Organized by upcoming, past, and cancelled events.
     """
-    rsvps = RSVP.objects.filter(user=request.user).select_related('event')
+    # One query for all of the user's RSVPs; a user only has a handful
+    rsvps = list(
+        RSVP.objects.filter(user=request.user).select_related('event').only(
+            'id', 'status', 'number_of_tickets', 'ticket_number', 'created_at', 'updated_at',
+            'event__title', 'event__slug', 'event__status', 'event__start_date', 'event__end_date',
+            'event__venue_name', 'event__city', 'event__banner_image', 'event__available_seats',
+        )
+    )
     
     # Current time
     now = timezone.now()
     
     # Separate by status and date
-    upcoming_rsvps = rsvps.filter(
-        status__in=['confirmed', 'pending'], 
-        event__start_date__gte=now
-    ).order_by('event__start_date')
+    upcoming_rsvps = sorted(
+        (r for r in rsvps if r.status in ('confirmed', 'pending') and r.event.start_date >= now),
+        key=lambda r: r.event.start_date
+    )
     
-    past_rsvps = rsvps.filter(
-        event__end_date__lt=now
-    ).exclude(status='cancelled').order_by('-event__start_date')
+    past_rsvps = sorted(
+        (r for r in rsvps if r.event.end_date < now and r.status != 'cancelled'),
+        key=lambda r: r.event.start_date,
+        reverse=True
+    )
     
-    cancelled_rsvps = rsvps.filter(status='cancelled').order_by('-created_at')
+    # Already newest first (model ordering)
+    cancelled_rsvps = [r for r in rsvps if r.status == 'cancelled']
     
     # Count statistics
-    total_attended = rsvps.filter(status='attended').count()
-    total_upcoming = upcoming_rsvps.count()
+    total_attended = sum(1 for r in rsvps if r.status == 'attended')
+    total_upcoming = len(upcoming_rsvps)
+    total_registrations = total_upcoming + len(past_rsvps)
     
     context = {
         'upcoming_rsvps': upcoming_rsvps,
@@ -231,6 +259,7 @@ def my_rsvps(request):
         'cancelled_rsvps': cancelled_rsvps,
         'total_attended': total_attended,
         'total_upcoming': total_upcoming,
+        'total_registrations': total_registrations,
         'title': 'My Registrations'
     }
     return render(request, 'rsvp/my_rsvps.html', context)
@@ -242,7 +271,9 @@ def cancel_rsvp(request, rsvp_id):
     Cancel an RSVP.
     Restores seats to event availability.
     """
-    rsvp = get_object_or_404(RSVP, id=rsvp_id, user=request.user)
+    rsvp = get_object_or_404(
+        RSVP.objects.select_related('event', 'user'), id=rsvp_id, user_id=request.user.id
+    )
     
     # Check if already cancelled
     if rsvp.status == 'cancelled':
@@ -268,11 +299,8 @@ def cancel_rsvp(request, rsvp_id):
             f'Your registration for {rsvp.event.title} has been cancelled. {rsvp.number_of_tickets} seat(s) have been released.'
         )
         
-        # Send cancellation notification (fails silently)
-        try:
-            send_rsvp_cancellation_email(rsvp, request)
-        except Exception as e:
-            print(f"Failed to send cancellation email: {e}")
+        # Send cancellation notification after the response is sent
+        run_in_background(send_rsvp_cancellation_task, rsvp.id, request.get_host())
         
         return redirect('rsvp:my_rsvps')
     
@@ -290,372 +318,319 @@ def download_ticket(request, rsvp_id):
     This is the main ticket generation functionality.
     Creates a professional PDF ticket with all event details.
     """
-    rsvp = get_object_or_404(RSVP, id=rsvp_id, user=request.user)
+    rsvp = get_object_or_404(
+        RSVP.objects.select_related('event', 'user'), id=rsvp_id, user_id=request.user.id
+    )
     
     # Check if RSVP is active
     if rsvp.status == 'cancelled':
         messages.error(request, 'Cannot download ticket for cancelled registration.')
         return redirect('rsvp:my_rsvps')
     
-    # Create PDF in memory
+    filename = f"ticket_{rsvp.ticket_number}.pdf"
+    
+    # Serve the stored PDF unless the RSVP or event changed after it was made
+    generated_at = rsvp.ticket_pdf_generated_at
+    if rsvp.ticket_pdf and generated_at and generated_at >= max(rsvp.updated_at, rsvp.event.updated_at):
+        try:
+            return FileResponse(
+                rsvp.ticket_pdf.open('rb'),
+                as_attachment=True,
+                filename=filename,
+                content_type='application/pdf'
+            )
+        except FileNotFoundError:
+            pass
+    
+    # Render the ticket (and its QR code if the background task hasn't yet)
+    if not rsvp.qr_code:
+        rsvp.generate_qr_code()
+    pdf = render_ticket_pdf(rsvp)
+    
+    # Store the PDF so later downloads skip rendering it
+    if rsvp.ticket_pdf:
+        rsvp.ticket_pdf.delete(save=False)
+    rsvp.ticket_pdf.save(filename, ContentFile(pdf), save=False)
+    rsvp.ticket_pdf_generated_at = timezone.now()
+    rsvp.save(update_fields=['ticket_pdf', 'ticket_pdf_generated_at'])
+    
+    # Stream the response in chunks instead of one HttpResponse body
+    return FileResponse(
+        BytesIO(pdf),
+        as_attachment=True,
+        filename=filename,
+        content_type='application/pdf'
+    )
+
+
+@login_required
+def event_attendees(request, event_slug):
+    """
+    Display list of attendees for an event.
+    Only accessible by event organizer.
+    Shows all confirmed registrations.
+    """
+    event = get_object_or_404(Event, slug=event_slug)
+    
+    # Check if user is the organizer
+    if event.organizer != request.user:
+        messages.error(request, 'You do not have permission to view this page.')
+        return redirect('events:event_detail', slug=event_slug)
+    
+    # Get all RSVPs except cancelled, with only the columns the list shows
+    rsvps = RSVP.objects.filter(
+        event=event
+    ).exclude(
+        status='cancelled'
+    ).select_related('user', 'user__profile').only(
+        'id', 'status', 'number_of_tickets', 'ticket_number', 'created_at',
+        'user__username', 'user__first_name', 'user__last_name', 'user__email',
+        'user__profile__phone', 'user__profile__profile_picture',
+    ).order_by('-created_at')
+    
+    # Calculate statistics in a single query
+    stats = rsvps.aggregate(
+        total_attendees=Count('id'),
+        total_tickets=Sum('number_of_tickets'),
+        confirmed_count=Count('id', filter=Q(status='confirmed')),
+        attended_count=Count('id', filter=Q(status='attended')),
+        pending_count=Count('id', filter=Q(status='pending')),
+    )
+    total_tickets = stats['total_tickets'] or 0
+    
+    # Calculate revenue for paid events
+    total_revenue = 0
+    if event.event_type == 'paid':
+        total_revenue = total_tickets * float(event.ticket_price)
+    
+    # Show the list a page at a time; big events can have thousands of rows
+    paginator = Paginator(rsvps, ATTENDEES_PER_PAGE)
+    page_obj = paginator.get_page(request.GET.get('page'))
+    
+    context = {
+        'event': event,
+        'rsvps': page_obj,
+        'page_obj': page_obj,
+        'total_attendees': stats['total_attendees'],
+        'total_tickets': total_tickets,
+        'confirmed_count': stats['confirmed_count'],
+        'attended_count': stats['attended_count'],
+        'pending_count': stats['pending_count'],
+        'total_revenue': total_revenue,
+        'title': f'Attendees - {event.title}'
+    }
+    return render(request, 'rsvp/event_attendees.html', context)
+
+
+class Echo:
+    """File-like object for csv.writer that hands each row back instead of storing it"""
+    
+    def write(self, value):
+        return value
+
+
+@login_required
+def export_attendees_csv(request, event_slug):
+    """
+    Download the attendee list of an event as CSV.
+    Only accessible by event organizer.
+    Rows are streamed from the database cursor, so memory use stays flat
+    however many people registered.
+    """
+    event = get_object_or_404(Event, slug=event_slug)
+    
+    # Check if user is the organizer
+    if event.organizer != request.user:
+        messages.error(request, 'You do not have permission to view this page.')
+        return redirect('events:event_detail', slug=event_slug)
+    
+    rows = RSVP.objects.filter(
+        event=event
+    ).exclude(
+        status='cancelled'
+    ).order_by('-created_at').values_list(
+        'user__username', 'user__first_name', 'user__last_name', 'user__email',
+        'ticket_number', 'number_of_tickets', 'status', 'created_at',
+        named=True
+    ).iterator(chunk_size=ATTENDEE_EXPORT_CHUNK_SIZE)
+    
+    writer = csv.writer(Echo())
+    
+    def stream():
+        yield writer.writerow([
+            'Username', 'Name', 'Email', 'Ticket Number', 'Tickets', 'Status', 'Registered On'
+        ])
+        for row in rows:
+            full_name = f'{row.user__first_name} {row.user__last_name}'.strip()
+            yield writer.writerow([
+                row.user__username,
+                full_name,
+                row.user__email,
+                row.ticket_number,
+                row.number_of_tickets,
+                row.status,
+                row.created_at.strftime('%Y-%m-%d %H:%M'),
+            ])
+    
+    response = StreamingHttpResponse(stream(), content_type='text/csv')
+    response['Content-Disposition'] = f'attachment; filename="attendees_{event.slug}.csv"'
+    return response
+
+
+# ==========================================
+# Helper Functions for Ticket PDFs
+# ==========================================
+
+# Ticket page layout
+PAGE_WIDTH, PAGE_HEIGHT = letter
+CENTER_X = PAGE_WIDTH / 2
+LABEL_X = 80
+VALUE_X = 180
+RIGHT_X = PAGE_WIDTH - 80
+QR_X = PAGE_WIDTH - 220
+QR_Y = 150
+QR_SIZE = 150
+
+STATUS_BADGES = {
+    'confirmed': ((0, 0.7, 0), "CONFIRMED"),
+    'attended': ((0.2, 0.6, 0.2), "ATTENDED"),
+}
+PENDING_BADGE_COLOR = (0.8, 0.6, 0)
+
+TICKET_NOTES = [
+    "• Please bring this ticket (printed or digital) to the event",
+    "• Arrive 15 minutes early for check-in",
+    "• This ticket is non-transferable",
+]
+
+
+def draw_section_header(p, y, title):
+    """Draw a section title with a rule under it"""
+    p.setFont("Helvetica-Bold", 16)
+    p.drawString(LABEL_X, y, title)
+    p.line(LABEL_X, y - 5, RIGHT_X, y - 5)
+
+
+def draw_detail_rows(p, rows):
+    """
+    Draw (y, label, value, value_font_size) rows as two columns.
+    All labels are drawn first, then all values, so the font only
+    changes once per column instead of twice per row.
+    """
+    p.setFont("Helvetica-Bold", 13)
+    for y, label, value, size in rows:
+        if label:
+            p.drawString(LABEL_X, y, label)
+    
+    current_size = None
+    for y, label, value, size in rows:
+        if size != current_size:
+            p.setFont("Helvetica", size)
+            current_size = size
+        p.drawString(VALUE_X, y, value)
+
+
+def render_ticket_pdf(rsvp):
+    """Render the PDF ticket for an RSVP and return its bytes"""
+    event = rsvp.event
     buffer = BytesIO()
     p = canvas.Canvas(buffer, pagesize=letter)
-    width, height = letter
     
     # Draw border
     p.setStrokeColorRGB(0.2, 0.2, 0.2)
     p.setLineWidth(2)
-    p.rect(50, 50, width - 100, height - 100, stroke=1, fill=0)
+    p.rect(50, 50, PAGE_WIDTH - 100, PAGE_HEIGHT - 100, stroke=1, fill=0)
     
     # Header - Title
     p.setFillColorRGB(0.2, 0.4, 0.8)
-    p.rect(50, height - 150, width - 100, 50, stroke=0, fill=1)
+    p.rect(50, PAGE_HEIGHT - 150, PAGE_WIDTH - 100, 50, stroke=0, fill=1)
     p.setFillColorRGB(1, 1, 1)
     p.setFont("Helvetica-Bold", 28)
-    p.drawCentredString(width / 2, height - 130, "EVENT TICKET")
+    p.drawCentredString(CENTER_X, PAGE_HEIGHT - 130, "EVENT TICKET")
     
     # Ticket Number (prominent)
     p.setFillColorRGB(0, 0, 0)
     p.setFont("Helvetica-Bold", 18)
-    p.drawString(80, height - 180, f"Ticket #: {rsvp.ticket_number}")
+    p.drawString(LABEL_X, PAGE_HEIGHT - 180, f"Ticket #: {rsvp.ticket_number}")
     
     # Status badge
-    if rsvp.status == 'confirmed':
-        status_color = (0, 0.7, 0)
-        status_text = "CONFIRMED"
-    elif rsvp.status == 'attended':
-        status_color = (0.2, 0.6, 0.2)
-        status_text = "ATTENDED"
-    else:
-        status_color = (0.8, 0.6, 0)
-        status_text = rsvp.status.upper()
-    
+    status_color, status_text = STATUS_BADGES.get(
+        rsvp.status, (PENDING_BADGE_COLOR, rsvp.status.upper())
+    )
     p.setFillColorRGB(*status_color)
     p.setFont("Helvetica-Bold", 14)
-    p.drawRightString(width - 80, height - 180, status_text)
+    p.drawRightString(RIGHT_X, PAGE_HEIGHT - 180, status_text)
     
-    # Event Details Section
+    # Event and attendee details
     p.setFillColorRGB(0, 0, 0)
-    p.setFont("Helvetica-Bold", 16)
-    p.drawString(80, height - 230, "Event Details")
-    
-    # Draw line under section header
     p.setStrokeColorRGB(0.7, 0.7, 0.7)
     p.setLineWidth(1)
-    p.line(80, height - 235, width - 80, height - 235)
-    
-    p.setFont("Helvetica-Bold", 13)
-    y_position = height - 260
-    
-    # Event Name
-    p.drawString(80, y_position, "Event:")
-    p.setFont("Helvetica", 12)
-    p.drawString(180, y_position, rsvp.event.title)
-    
-    # Date
-    y_position -= 25
-    p.setFont("Helvetica-Bold", 13)
-    p.drawString(80, y_position, "Date:")
-    p.setFont("Helvetica", 12)
-    p.drawString(180, y_position, rsvp.event.start_date.strftime('%B %d, %Y'))
-    
-    # Time
-    y_position -= 25
-    p.setFont("Helvetica-Bold", 13)
-    p.drawString(80, y_position, "Time:")
-    p.setFont("Helvetica", 12)
-    time_str = f"{rsvp.event.start_date.strftime('%I:%M %p')} - {rsvp.event.end_date.strftime('%I:%M %p')}"
-    p.drawString(180, y_position, time_str)
-    
-    # Venue
-    y_position -= 25
-    p.setFont("Helvetica-Bold", 13)
-    p.drawString(80, y_position, "Venue:")
-    p.setFont("Helvetica", 12)
-    p.drawString(180, y_position, rsvp.event.venue_name)
-    
-    # Address
-    y_position -= 25
-    p.setFont("Helvetica-Bold", 13)
-    p.drawString(80, y_position, "Address:")
-    p.setFont("Helvetica", 11)
-    p.drawString(180, y_position, rsvp.event.venue_address)
-    
-    # City
-    y_position -= 20
-    p.drawString(180, y_position, f"{rsvp.event.city}, {rsvp.event.state}, {rsvp.event.country}")
-    
-    # Attendee Details Section
-    y_position -= 50
-    p.setFont("Helvetica-Bold", 16)
-    p.drawString(80, y_position, "Attendee Details")
-    
-    # Draw line
-    p.line(80, y_position - 5, width - 80, y_position - 5)
-    
-    y_position -= 30
-    p.setFont("Helvetica-Bold", 13)
-    p.drawString(80, y_position, "Name:")
-    p.setFont("Helvetica", 12)
-    full_name = rsvp.user.get_full_name() or rsvp.user.username
-    p.drawString(180, y_position, full_name)
-    
-    # Email
-    y_position -= 25
-    p.setFont("Helvetica-Bold", 13)
-    p.drawString(80, y_position, "Email:")
-    p.setFont("Helvetica", 12)
-    p.drawString(180, y_position, rsvp.user.email)
     
-    # Number of Tickets
-    y_position -= 25
-    p.setFont("Helvetica-Bold", 13)
-    p.drawString(80, y_position, "Tickets:")
-    p.setFont("Helvetica", 12)
-    p.drawString(180, y_position, str(rsvp.number_of_tickets))
+    event_y = PAGE_HEIGHT - 230
+    attendee_y = event_y - 200
+    draw_section_header(p, event_y, "Event Details")
+    draw_section_header(p, attendee_y, "Attendee Details")
+    
+    time_str = f"{event.start_date.strftime('%I:%M %p')} - {event.end_date.strftime('%I:%M %p')}"
+    draw_detail_rows(p, [
+        (event_y - 30, "Event:", event.title, 12),
+        (event_y - 55, "Date:", event.start_date.strftime('%B %d, %Y'), 12),
+        (event_y - 80, "Time:", time_str, 12),
+        (event_y - 105, "Venue:", event.venue_name, 12),
+        (attendee_y - 30, "Name:", rsvp.user.get_full_name() or rsvp.user.username, 12),
+        (attendee_y - 55, "Email:", rsvp.user.email, 12),
+        (attendee_y - 80, "Tickets:", str(rsvp.number_of_tickets), 12),
+        (event_y - 130, "Address:", event.venue_address, 11),
+        (event_y - 150, None, f"{event.city}, {event.state}, {event.country}", 11),
+    ])
     
     # QR Code Section
-    if rsvp.qr_code and os.path.exists(rsvp.qr_code.path):
+    if rsvp.qr_code:
         try:
-            qr_image = ImageReader(rsvp.qr_code.path)
-            
-            # QR Code box
-            qr_x = width - 220
-            qr_y = 150
-            qr_size = 150
+            # Read through the storage API so non-local backends work too
+            with rsvp.qr_code.open('rb') as qr_file:
+                qr_image = ImageReader(BytesIO(qr_file.read()))
             
             # Draw QR code background
             p.setFillColorRGB(0.95, 0.95, 0.95)
-            p.rect(qr_x - 10, qr_y - 10, qr_size + 20, qr_size + 20, stroke=1, fill=1)
+            p.rect(QR_X - 10, QR_Y - 10, QR_SIZE + 20, QR_SIZE + 20, stroke=1, fill=1)
             
             # Draw QR code
-            p.drawImage(qr_image, qr_x, qr_y, width=qr_size, height=qr_size)
+            p.drawImage(qr_image, QR_X, QR_Y, width=QR_SIZE, height=QR_SIZE)
             
             # QR Code instructions
             p.setFillColorRGB(0, 0, 0)
             p.setFont("Helvetica-Bold", 10)
-            p.drawCentredString(qr_x + qr_size/2, qr_y - 25, "SCAN FOR CHECK-IN")
+            p.drawCentredString(QR_X + QR_SIZE / 2, QR_Y - 25, "SCAN FOR CHECK-IN")
         except Exception as e:
             # If QR code cannot be loaded, show message
             p.setFont("Helvetica", 10)
-            p.drawString(width - 220, 200, "QR Code unavailable")
+            p.drawString(QR_X, 200, "QR Code unavailable")
     
-    # Important Notes Section
-    y_position = 120
+    # Important Notes Section, drawn as one text block
     p.setFont("Helvetica-Bold", 12)
-    p.drawString(80, y_position, "Important Notes:")
-    
-    y_position -= 20
-    p.setFont("Helvetica", 9)
-    p.drawString(80, y_position, "• Please bring this ticket (printed or digital) to the event")
+    p.drawString(LABEL_X, 120, "Important Notes:")
     
-    y_position -= 15
-    p.drawString(80, y_position, "• Arrive 15 minutes early for check-in")
-    
-    y_position -= 15
-    p.drawString(80, y_position, "• This ticket is non-transferable")
-    
-    y_position -= 15
-    p.drawString(80, y_position, f"• Event Type: {rsvp.event.get_event_type_display()}")
+    notes = TICKET_NOTES + [f"• Event Type: {event.get_event_type_display()}"]
+    if event.event_type == 'paid':
+        notes.append(f"• Ticket Price: ₹{event.ticket_price} per ticket")
     
-    if rsvp.event.event_type == 'paid':
-        y_position -= 15
-        p.drawString(80, y_position, f"• Ticket Price: ₹{rsvp.event.ticket_price} per ticket")
+    text = p.beginText(LABEL_X, 100)
+    text.setFont("Helvetica", 9, leading=15)
+    text.textLines(notes)
+    p.drawText(text)
     
-   # Footer
+    # Footer
     p.setFont("Helvetica-Oblique", 8)
     p.setFillColorRGB(0.5, 0.5, 0.5)
     p.drawCentredString(
-        width / 2, 
-        70, 
+        CENTER_X,
+        70,
         f"Generated on {timezone.now().strftime('%B %d, %Y at %I:%M %p')}"
     )
-    p.drawCentredString(width / 2, 60, "Event Management System")
+    p.drawCentredString(CENTER_X, 60, "Event Management System")
     
     # Finalize PDF
     p.showPage()
     p.save()
-    
-    # Get PDF content
-    buffer.seek(0)
-    
-    # Create HTTP response
-    response = HttpResponse(buffer, content_type='application/pdf')
-    filename = f"ticket_{rsvp.ticket_number}.pdf"
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    return response
-
-
-@login_required
-def event_attendees(request, event_slug):
-    """
-    Display list of attendees for an event.
-    Only accessible by event organizer.
-    Shows all confirmed registrations.
-    """
-    event = get_object_or_404(Event, slug=event_slug)
-    
-    # Check if user is the organizer
-    if event.organizer != request.user:
-        messages.error(request, 'You do not have permission to view this page.')
-        return redirect('events:event_detail', slug=event_slug)
-    
-    # Get all RSVPs except cancelled (removed 'user__profile')
-    rsvps = RSVP.objects.filter(
-        event=event
-    ).exclude(
-        status='cancelled'
-    ).select_related('user').order_by('-created_at')
-    
-    # Calculate statistics
-    total_attendees = rsvps.count()
-    total_tickets = sum(rsvp.number_of_tickets for rsvp in rsvps)
-    confirmed_count = rsvps.filter(status='confirmed').count()
-    attended_count = rsvps.filter(status='attended').count()
-    pending_count = rsvps.filter(status='pending').count()
-    
-    # Calculate revenue for paid events
-    total_revenue = 0
-    if event.event_type == 'paid':
-        total_revenue = sum(
-            rsvp.number_of_tickets * float(event.ticket_price) 
-            for rsvp in rsvps
-        )
-    
-    context = {
-        'event': event,
-        'rsvps': rsvps,
-        'total_attendees': total_attendees,
-        'total_tickets': total_tickets,
-        'confirmed_count': confirmed_count,
-        'attended_count': attended_count,
-        'pending_count': pending_count,
-        'total_revenue': total_revenue,
-        'title': f'Attendees - {event.title}'
-    }
-    return render(request, 'rsvp/event_attendees.html', context)
-
-
-# ==========================================
-# Helper Functions for Email Notifications
-# ==========================================
-
-def send_rsvp_confirmation_email(rsvp, request):
-    """Send confirmation email to attendee when RSVP is created"""
-    try:
-        context = {
-            'rsvp': rsvp,
-            'domain': request.get_host(),
-        }
-        
-        subject = f'Registration Confirmed - {rsvp.event.title}'
-        html_message = render_to_string(
-            'notifications/emails/rsvp_confirmed.html', 
-            context
-        )
-        plain_message = render_to_string(
-            'notifications/emails/rsvp_confirmed.txt', 
-            context
-        )
-        
-        send_mail(
-            subject,
-            plain_message,
-            settings.DEFAULT_FROM_EMAIL,
-            [rsvp.user.email],
-            html_message=html_message,
-            fail_silently=True,
-        )
-    except Exception as e:
-        print(f"Error sending RSVP confirmation email: {e}")
-        raise
-
-
-def send_organizer_notification_email(rsvp, request):
-    """Send notification to event organizer when someone registers"""
-    try:
-        event = rsvp.event
-        
-        # Calculate statistics
-        total_registrations = RSVP.objects.filter(
-            event=event
-        ).exclude(status='cancelled').count()
-        
-        total_tickets = RSVP.objects.filter(
-            event=event
-        ).exclude(status='cancelled').aggregate(
-            total=Sum('number_of_tickets')
-        )['total'] or 0
-        
-        booking_percentage = (total_tickets / event.total_seats * 100) if event.total_seats > 0 else 0
-        
-        # Calculate revenue for paid events
-        revenue = rsvp.number_of_tickets * float(event.ticket_price) if event.event_type == 'paid' else 0
-        total_revenue = total_tickets * float(event.ticket_price) if event.event_type == 'paid' else 0
-        
-        context = {
-            'rsvp': rsvp,
-            'event': event,
-            'organizer': event.organizer,
-            'domain': request.get_host(),
-            'total_registrations': total_registrations,
-            'total_tickets': total_tickets,
-            'booking_percentage': booking_percentage,
-            'revenue': revenue,
-            'total_revenue': total_revenue,
-        }
-        
-        subject = f'New Registration for {event.title}'
-        html_message = render_to_string(
-            'notifications/emails/new_registration_organizer.html', 
-            context
-        )
-        plain_message = render_to_string(
-            'notifications/emails/new_registration_organizer.txt', 
-            context
-        )
-        
-        send_mail(
-            subject,
-            plain_message,
-            settings.DEFAULT_FROM_EMAIL,
-            [event.organizer.email],
-            html_message=html_message,
-            fail_silently=True,
-        )
-    except Exception as e:
-        print(f"Error sending organizer notification email: {e}")
-        raise
-
-
-def send_rsvp_cancellation_email(rsvp, request):
-    """Send notification email when RSVP is cancelled"""
-    try:
-        context = {
-            'rsvp': rsvp,
-            'domain': request.get_host(),
-            'refund_info': rsvp.event.ticket_price > 0,
-        }
-        
-        subject = f'Registration Cancelled - {rsvp.event.title}'
-        html_message = render_to_string(
-            'notifications/emails/rsvp_cancelled.html', 
-            context
-        )
-        plain_message = render_to_string(
-            'notifications/emails/rsvp_cancelled.txt', 
-            context
-        )
-        
-        send_mail(
-            subject,
-            plain_message,
-            settings.DEFAULT_FROM_EMAIL,
-            [rsvp.user.email],
-            html_message=html_message,
-            fail_silently=True,
-        )
-    except Exception as e:
-        print(f"Error sending RSVP cancellation email: {e}")
-        raise
\ No newline at end of file
+    return buffer.getvalue()
@@ -1,8 +1,10 @@
 from django.shortcuts import render
-from django.db.models import Q, Count
+from django.db.models import Q, Count, BooleanField, ExpressionWrapper
 from django.core.paginator import Paginator
 from django.utils import timezone
+from django.contrib.auth.models import User
 from events.models import Event #, Category
+from events.utils import EVENT_FULLTEXT_COLUMNS, fulltext_match, fulltext_relevance, get_published_cities
 
 def search_events(request):
     """
@@ -16,22 +18,37 @@ def search_events(request):
     city = request.GET.get('city', '')
     date_from = request.GET.get('date_from', '')
     date_to = request.GET.get('date_to', '')
-    sort_by = request.GET.get('sort', 'date')
+    # Keyword searches rank by relevance unless another order is picked
+    sort_by = request.GET.get('sort') or ('relevance' if query else 'date')
     status = request.GET.get('status', 'upcoming')
     
     # Base queryset - only published events
     events = Event.objects.filter(status='published').select_related('organizer') #.select_related('category', 'organizer')
     
-    # Keyword search
+    # Keyword search (FULLTEXT index on MySQL, icontains elsewhere)
+    relevance = None
     if query:
-        events = events.filter(
-            Q(title__icontains=query) |
-            Q(description__icontains=query) |
-            Q(venue_name__icontains=query) |
-            Q(city__icontains=query) |
-            Q(organizer__first_name__icontains=query) |
-            Q(organizer__last_name__icontains=query)
-        )
+        organizer_ids = User.objects.filter(
+            Q(first_name__icontains=query) |
+            Q(last_name__icontains=query)
+        ).values('id')
+        match = fulltext_match(EVENT_FULLTEXT_COLUMNS, query)
+        if match is not None:
+            # An OR with the organizer columns would stop MySQL using the
+            # FULLTEXT index, so each side selects its own ids and they are UNIONed
+            matching_ids = Event.objects.filter(match).order_by().values('id').union(
+                Event.objects.filter(organizer_id__in=organizer_ids).order_by().values('id')
+            )
+            events = events.filter(pk__in=matching_ids)
+            relevance = fulltext_relevance(EVENT_FULLTEXT_COLUMNS, query)
+        else:
+            events = events.filter(
+                Q(title__icontains=query) |
+                Q(description__icontains=query) |
+                Q(venue_name__icontains=query) |
+                Q(city__icontains=query) |
+                Q(organizer_id__in=organizer_ids)
+            )
     
     # Filter by category
     # if category_id:
@@ -59,8 +76,15 @@ def search_events(request):
     elif status == 'past':
         events = events.filter(end_date__lt=now)
     
-    # Sorting
-    if sort_by == 'date':
+    # Flag past events in SQL instead of calling is_past() per result card
+    events = events.annotate(
+        has_ended=ExpressionWrapper(Q(end_date__lt=now), output_field=BooleanField())
+    )
+    
+    # Sorting (relevance needs the MATCH score, so without it sort by date)
+    if sort_by == 'relevance' and relevance is not None:
+        events = events.annotate(relevance=relevance).order_by('-relevance', 'start_date')
+    elif sort_by in ('date', 'relevance'):
         events = events.order_by('start_date')
     elif sort_by == 'date_desc':
         events = events.order_by('-start_date')
@@ -79,17 +103,15 @@ def search_events(request):
     # categories = Category.objects.all()
     
     # Get unique cities for filter dropdown
-    cities = Event.objects.filter(
-        status='published'
-    ).values_list('city', flat=True).distinct().order_by('city')
+    cities = get_published_cities()
     
     # Pagination
     paginator = Paginator(events, 12)  # 12 events per page
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
-    # Search statistics
-    total_results = events.count()
+    # Search statistics (the paginator already counted the results)
+    total_results = paginator.count
     
     context = {
         'page_obj': page_obj,
@@ -134,9 +156,7 @@ def search_events(request):
 def advanced_search(request):
     """Display advanced search form with all filter options"""
     # categories = Category.objects.all()
-    cities = Event.objects.filter(
-        status='published'
-    ).values_list('city', flat=True).distinct().order_by('city')
+    cities = get_published_cities()
     
     context = {
         # 'categories': categories,